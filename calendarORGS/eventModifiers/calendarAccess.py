@@ -102,19 +102,9 @@ class EventObj:
         connector.cursor.execute("SELECT event, description, unixtimeStart, unixtimeEnd, location, summary "
                                  "FROM events WHERE event = ?", (iD,))
         event = connector.cursor.fetchone()
-        if event:
-            self.iD = event[0]
-            self.description = event[1]
-            self.start = event[2]
-            self.end = event[3]
-            self.startParsed = TimeConverter(unixtime=event[2]).generateTimeDataObj()
-            self.endParsed = TimeConverter(unixtime=event[3]).generateTimeDataObj()
-            self.startFromDay = self.start - TimeStarts(generationTime=self.start).today["start"]
-            self.summary = event[5]
-            self.location = event[4]
-            return EventObj(event)
-        else:
-            return None
+
+        # The constructor does all of the parsing, so the row is only converted once
+        return EventObj(event) if event else None
 class EventSorter:
     """
     Organizes and categorizes events by different time periods.
@@ -340,27 +330,22 @@ class CalendarView:
         Returns:
             list: List of strings containing formatted event information grouped by day
         """
-        events = Scheduler.giveEvents(timeForecast)
-        dayCheck = []
+        events = Scheduler.giveCachedEvents(timeForecast)
+        dayCheck = set()
         output = []
 
-        events.sort(key=lambda x: x[2])
-
         dateSplit = timeForecast.split(" ")
         output.append(f"Events in the next {dateSplit[0]} days:")
 
-        for item in events:
-            daySet = toShortHumanTime(item[2])
+        for name, _, start, end in events:
+            daySet = toShortHumanTime(start)
 
             if daySet not in dayCheck:
                 # First event for this day - add day header
-                dayCheck.append(daySet)
+                dayCheck.add(daySet)
                 output.append(f"Events on {daySet}:")
-                output.append(f"{item[0]} from {toHumanHour(item[2])} to {toHumanHour(item[3])}")
 
-            else:
-                # Additional event for same day - just add event info
-                output.append(f"{item[0]} from {toHumanHour(item[2])} to {toHumanHour(item[3])}")
+            output.append(f"{name} from {toHumanHour(start)} to {toHumanHour(end)}")
 
         return output
 
@@ -45,19 +45,19 @@ class gCalInteract:
     def insertEvent(self, eventObject: EventObj):
         startDatetime = TimeConverter(timeDataObj=eventObject.startParsed).convertToDateTime()
         endDatetime = TimeConverter(timeDataObj=eventObject.endParsed).convertToDateTime()
+        userTimezone = Configs().mainConfig['USER_TIMEZONE']
         payload = {
             'summary': eventObject.summary,
             'description': eventObject.description,
             'start': {
                 'dateTime': startDatetime.isoformat(),
-                'timeZone': Configs().mainConfig['USER_TIMEZONE']
+                'timeZone': userTimezone
             },
             'end': {
                 'dateTime': endDatetime.isoformat(),
-                'timeZone': Configs().mainConfig['USER_TIMEZONE']
+                'timeZone': userTimezone
             },
         }
-        print(payload)
 
         if eventObject.location:
             payload['location'] = eventObject.location
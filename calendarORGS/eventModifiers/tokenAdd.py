@@ -5,13 +5,20 @@ This module contains the TokenAdd class which handles the creation of new events
 tasks, and time blocks in the lifeORGS system. It provides database operations
 for adding calendar items with proper validation and error handling.
 
-The module interacts with the SQLite database to create the necessary tables
-and insert new records based on the tokenized command information.
+The module interacts with the SQLite database to insert new records based on
+the tokenized command information. Table creation is handled once by ConnectDB.
 """
 
 from userInteraction.parsing.tokenize import Tokens
+from calendarORGS.scheduling.eventScheduler import Scheduler
 from utils.dbUtils import ConnectDB
 
+# SQL text shared by the single-row and batch handlers so each statement is only ever one cached string
+_INSERT_EVENT_SQL = ("INSERT INTO events (event, description, unixtimeStart, unixtimeEnd, location, summary, status, class) "
+                     "VALUES (?,?,?,?,?,?,?,?)")
+_INSERT_TASK_SQL = "INSERT INTO tasks VALUES (?,?,?,?,?,?)"
+_INSERT_BLOCK_SQL = "INSERT INTO blocks VALUES (?,?)"
+
 
 class TokenAdd:
     """
@@ -19,7 +26,7 @@ class TokenAdd:
 
     This class processes ADD commands by creating new database entries for events,
     tasks, or time blocks based on the tokenized command information. It handles
-    database table creation, duplicate checking, and data insertion.
+    duplicate checking and data insertion.
 
     Attributes:
         tokens (Tokens): The tokenized command object containing all parameters
@@ -36,13 +43,50 @@ class TokenAdd:
         """
         self.tokens = tokenObject
 
+    @staticmethod
+    def _eventRow(tokens: Tokens) -> tuple:
+        """
+        Build the events table row for a tokenized EVENT ADD command.
+
+        Args:
+            tokens (Tokens): The tokenized command holding the event fields
+
+        Returns:
+            tuple: Values in events column order, ready to bind to an INSERT
+        """
+        return (tokens.numID,
+                tokens.description,
+                tokens.startTime,
+                tokens.endTime,
+                tokens.physicalLocation,
+                tokens.iD,
+                "CONFIRMED",
+                "PRIVATE")
+
+    @staticmethod
+    def _taskRow(tokens: Tokens) -> tuple:
+        """
+        Build the tasks table row for a tokenized TASK ADD command.
+
+        Args:
+            tokens (Tokens): The tokenized command holding the task fields
+
+        Returns:
+            tuple: Values in tasks column order, ready to bind to an INSERT
+        """
+        return (tokens.iD,
+                tokens.taskTime,
+                tokens.urgency,
+                False,
+                tokens.dueDate,
+                False)
+
     def addEvent(self):
         """
         Add a new event to the events database table.
 
-        Creates the events table if it doesn't exist, checks for duplicate events
-        that haven't ended yet, and inserts a new event record with the provided
-        information from the tokens object.
+        Checks for duplicate events that haven't ended yet and inserts a new event
+        record with the provided information from the tokens object.
 
         The method prevents duplicate events by checking if an event with the same
         name exists and has an end time in the future.
@@ -59,33 +103,18 @@ class TokenAdd:
             - description (text): EventObj description
             - unixtimeStart (integer): EventObj start time as Unix timestamp
             - unixtimeEnd (integer): EventObj end time as Unix timestamp
-            - task (boolean): Whether this is a task (default: False)
+            - location (text): Physical location of the event
+            - summary (text): EventObj display name
+            - status (text): iCalendar status (default: 'CONFIRMED')
+            - class (text): iCalendar access class (default: 'PRIVATE')
+            - task (boolean): Whether this is a scheduled task (default: False)
             - completed (boolean): Whether the event is completed (default: False)
         """
         connector = ConnectDB()
 
-        table = """ CREATE TABLE IF NOT EXISTS events
-                    (
-                        event         text,
-                        description   text,
-                        unixtimeStart integer,
-                        unixtimeEnd   integer,
-                        location      text,
-                        summary       text,
-                        status        text default 'CONFIRMED',
-                        class         text default 'PRIVATE'
-                    ); """
-        connector.cursor.execute(table)
-
-        connector.cursor.execute("INSERT INTO events VALUES (?,?,?,?,?,?,?,?)", (self.tokens.numID,
-                                                                                 self.tokens.description,
-                                                                                 self.tokens.startTime,
-                                                                                 self.tokens.endTime,
-                                                                                 self.tokens.physicalLocation,
-                                                                                 self.tokens.iD,
-                                                                                 "CONFIRMED",
-                                                                                 "PRIVATE"))
-        connector.conn.commit()
+        with connector.conn:
+            connector.cursor.execute(_INSERT_EVENT_SQL, self._eventRow(self.tokens))
+        Scheduler.eventsChanged()
 
         return f"{self.tokens.iD} added successfully."
 
@@ -93,11 +122,10 @@ class TokenAdd:
         """
         Add a new task to the tasks database table.
 
-        Creates the tasks table if it doesn't exist, checks for duplicate incomplete tasks,
-        and inserts a new task record with the provided information from the tokens object.
+        Inserts a new task record with the provided information from the tokens object.
 
-        The method prevents duplicate tasks by checking if a task with the same name
-        already exists and is not completed.
+        Duplicate incomplete tasks are rejected by the same check addTasks makes, which
+        also holds on databases where the unique index on open task names is missing.
 
         Returns:
             str: Success message indicating the task was added successfully
@@ -114,44 +142,16 @@ class TokenAdd:
             - dueDate (integer): Task due date as Unix timestamp
             - completed (boolean): Whether the task is completed (default: False)
         """
-        connector = ConnectDB()
-
-        table = """ CREATE TABLE IF NOT EXISTS tasks
-                    (
-                        task      text,
-                        unixtime  integer,
-                        urgency   integer,
-                        scheduled boolean default 0,
-                        dueDate   integer,
-                        completed boolean default 0
-                    ); """
-
-        connector.cursor.execute(table)
-        connector.cursor.execute("SELECT task FROM tasks WHERE task=? AND completed == False", (self.tokens.iD,))
-        rows = connector.cursor.fetchall()
-
-        if len(rows) != 0:
-            raise Exception(f"{self.tokens.iD} already exists in the database and is not completed.")
-        else:
-
-            connector.cursor.execute("INSERT INTO tasks VALUES (?,?,?,?,?,?)", (self.tokens.iD,
-                                                                                self.tokens.taskTime,
-                                                                                self.tokens.urgency,
-                                                                                False,
-                                                                                self.tokens.dueDate,
-                                                                                False))
-
-            connector.conn.commit()
-
-            return f"{self.tokens.iD} added successfully."
+        # A single task is just a batch of one
+        TokenAdd.addTasks([self.tokens])
+        return f"{self.tokens.iD} added successfully."
 
     def addBlock(self):
         """
         Add a new time block to the blocks database table.
 
-        Creates the blocks table if it doesn't exist and inserts a new time block
-        record with the start and end times from the tokens object. Time blocks
-        define available periods for automatic task scheduling.
+        Inserts a new time block record with the start and end times from the
+        tokens object. Time blocks define available periods for automatic task scheduling.
 
         Unlike events and tasks, time blocks don't check for duplicates as multiple
         overlapping time blocks may be intentionally created for scheduling flexibility.
@@ -164,18 +164,95 @@ class TokenAdd:
             - timeStart (integer): Block start time as Unix timestamp
             - timeEnd (integer): Block end time as Unix timestamp
         """
+        # A single block is just a batch of one
+        TokenAdd.addBlocks([self.tokens])
+        return f"Time block added."
+
+    @staticmethod
+    def addEvents(tokenObjects: list[Tokens]):
+        """
+        Add several events to the events database table in one transaction.
+
+        All rows are built up front and written with a single executemany call,
+        so a bulk import costs one commit instead of one per event.
+
+        Args:
+            tokenObjects (list[Tokens]): Tokenized EVENT ADD commands to insert
+
+        Returns:
+            str: Success message with the number of events added
+        """
+        rows = [TokenAdd._eventRow(tokens) for tokens in tokenObjects]
+
         connector = ConnectDB()
+        with connector.conn:
+            connector.cursor.executemany(_INSERT_EVENT_SQL, rows)
+        Scheduler.eventsChanged()
 
-        # Create blocks table if it doesn't exist
-        table = """ CREATE TABLE IF NOT EXISTS blocks
-                    (
-                        timeStart integer,
-                        timeEnd   integer
-                    ); """
+        return f"{len(rows)} events added successfully."
 
-        connector.cursor.execute(table)
+    @staticmethod
+    def addTasks(tokenObjects: list[Tokens]):
+        """
+        Add several tasks to the tasks database table in one transaction.
 
-        # Insert the time block into the database
-        connector.cursor.execute("INSERT INTO blocks VALUES (?,?)", (self.tokens.blockStart, self.tokens.blockEnd))
-        connector.conn.commit()
-        return f"Time block added."
+        This is the only place the duplicate rule is checked (addTask is a batch of
+        one): nothing is written if any task name is repeated in the batch or already
+        exists in the database without being completed.
+
+        Args:
+            tokenObjects (list[Tokens]): Tokenized TASK ADD commands to insert
+
+        Returns:
+            str: Success message with the number of tasks added
+
+        Raises:
+            Exception: If a task name is duplicated in the batch or already exists and is not completed
+        """
+        rows = [TokenAdd._taskRow(tokens) for tokens in tokenObjects]
+        names = [row[0] for row in rows]
+
+        if len(set(names)) != len(names):
+            raise Exception("The same task was given more than once.")
+
+        connector = ConnectDB()
+        placeholders = ",".join("?" * len(names))
+
+        with connector.conn:
+            # Hold the write lock from the check to the insert, so no other writer can
+            # add one of these tasks in between
+            connector.cursor.execute("BEGIN IMMEDIATE")
+            connector.cursor.execute(f"SELECT task FROM tasks WHERE task IN ({placeholders}) "
+                                     f"AND completed == False LIMIT 1", names)
+            existing = connector.cursor.fetchone()
+
+            if existing is not None:
+                raise Exception(f"{existing[0]} already exists in the database and is not completed.")
+
+            connector.cursor.executemany(_INSERT_TASK_SQL, rows)
+
+        return f"{len(rows)} tasks added successfully."
+
+    @staticmethod
+    def addBlocks(tokenObjects: list[Tokens]):
+        """
+        Add several time blocks to the blocks database table in one transaction.
+
+        The write lock is taken up front with BEGIN IMMEDIATE, so a bulk load either
+        waits for other writers before starting or fails before inserting anything,
+        and is committed with a single sync.
+
+        Args:
+            tokenObjects (list[Tokens]): Tokenized BLOCK ADD commands to insert
+
+        Returns:
+            str: Success message with the number of time blocks added
+        """
+        rows = [(tokens.blockStart, tokens.blockEnd) for tokens in tokenObjects]
+
+        connector = ConnectDB()
+        with connector.conn:
+            connector.cursor.execute("BEGIN IMMEDIATE")
+            connector.cursor.executemany(_INSERT_BLOCK_SQL, rows)
+
+        return f"{len(rows)} time blocks added."
@@ -1,27 +1,42 @@
 from userInteraction.parsing.tokenize import Tokens
+from calendarORGS.scheduling.eventScheduler import Scheduler
 from utils.dbUtils import ConnectDB
-from calendarORGS.eventModifiers.tokenRemove import TokenRemove
+
+# One prebuilt statement per column MODIFY may change. Column names can't be bound as
+# parameters, so these tables double as the allow-list for the formatted column name.
+_MODIFY_EVENT_SQL = {column: f"UPDATE events SET {column}=? WHERE event=?"
+                     for column in ("description", "unixtimeStart", "unixtimeEnd")}
+_MODIFY_TASK_SQL = {column: f"UPDATE tasks SET {column}=?, scheduled=0 WHERE task=?"
+                    for column in ("dueDate", "unixtime", "urgency")}
 
 class TokenModify:
     def __init__(self, tokenObject: Tokens):
         self.tokens = tokenObject
 
+    @staticmethod
+    def _statement(statements, column):
+        if column not in statements:
+            raise Exception(f"{column} cannot be modified.")
+        return statements[column]
+
     def modifyEvent(self):
+        sql = self._statement(_MODIFY_EVENT_SQL, self.tokens.modVerb)
+
         connector = ConnectDB()
-        connector.cursor.execute(f"UPDATE events SET {self.tokens.modVerb}=? WHERE event=?",
-                                 (self.tokens.modContext, self.tokens.iD))
-        connector.conn.commit()
+        with connector.conn:
+            connector.cursor.execute(sql, (self.tokens.modContext, self.tokens.iD))
+        connector.dbCleanup()
+        Scheduler.eventsChanged()
 
     def modifyTask(self):
-        connector = ConnectDB()
-        connector.cursor.execute("SELECT event FROM events WHERE event=?", (self.tokens.iD,))
-        row = connector.cursor.fetchone()
+        sql = self._statement(_MODIFY_TASK_SQL, self.tokens.modVerb)
 
-        if row is not None:
-            TokenRemove.removeEvent(TokenRemove(self.tokens))
+        connector = ConnectDB()
 
-        connector.cursor.execute(f"UPDATE tasks SET {self.tokens.modVerb}=? WHERE task=?",
-                                 (self.tokens. modContext, self.tokens.iD))
-        connector.cursor.execute("UPDATE tasks SET scheduled=0 WHERE task=?", (self.tokens.iD,))
+        with connector.conn:
+            # Drop the task's scheduled event and mark it unscheduled in the same transaction as the edit
+            connector.cursor.execute("DELETE FROM events WHERE event=?", (self.tokens.iD,))
+            connector.cursor.execute(sql, (self.tokens.modContext, self.tokens.iD))
 
-        connector.conn.commit()
+        connector.dbCleanup()
+        Scheduler.eventsChanged()
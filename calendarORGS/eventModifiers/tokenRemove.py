@@ -1,26 +1,35 @@
 from userInteraction.parsing.tokenize import Tokens
+from calendarORGS.scheduling.eventScheduler import Scheduler
 from utils.dbUtils import ConnectDB
 
+_DELETE_EVENT_SQL = "DELETE FROM events WHERE event=?"
+_DELETE_TASK_SQL = "DELETE FROM tasks WHERE task=?"
+_DELETE_BLOCK_SQL = "DELETE FROM blocks WHERE timeStart=? AND timeEnd=?"
+
 class TokenRemove:
     def __init__(self, tokenObject: Tokens):
         self.tokens = tokenObject
 
     def removeEvent(self):
         connector = ConnectDB()
-        connector.cursor.execute("DELETE FROM events WHERE event=?", (self.tokens.iD,))
-        connector.conn.commit()
+        with connector.conn:
+            connector.cursor.execute(_DELETE_EVENT_SQL, (self.tokens.iD,))
+        connector.dbCleanup()
+        Scheduler.eventsChanged()
         return f"{self.tokens.iD} removed successfully."
 
     def removeTask(self):
         connector = ConnectDB()
-        connector.cursor.execute("DELETE FROM tasks WHERE task=?", (self.tokens.iD,))
-        connector.cursor.execute("DELETE FROM events WHERE event=?", (self.tokens.iD,))
-        connector.conn.commit()
+        with connector.conn:
+            connector.cursor.execute(_DELETE_TASK_SQL, (self.tokens.iD,))
+            connector.cursor.execute(_DELETE_EVENT_SQL, (self.tokens.iD,))
+        connector.dbCleanup()
+        Scheduler.eventsChanged()
         return f"{self.tokens.iD} removed successfully."
 
     def removeBlock(self):
         connector = ConnectDB()
-        connector.cursor.execute("DELETE FROM blocks WHERE timeStart=? AND timeEnd=?", (self.tokens.blockStart,
-                                                                                      self.tokens.blockEnd))
-        connector.conn.commit()
+        with connector.conn:
+            connector.cursor.execute(_DELETE_BLOCK_SQL, (self.tokens.blockStart, self.tokens.blockEnd))
+        connector.dbCleanup()
         return f"Time block removed successfully."
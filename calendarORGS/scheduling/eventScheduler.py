@@ -23,7 +23,12 @@ Dependencies:
 - utils.timeUtils: Time conversion and formatting utilities
 - utils.dbUtils: Database path management
 """
+import bisect
+import heapq
+import itertools
+import math
 import time
+from operator import itemgetter
 
 from utils.dbUtils import ConnectDB
 from utils.timeUtilitities.timeUtil import timeOut, toShortHumanTime, toHumanHour, deltaToStartOfWeek
@@ -48,6 +53,11 @@ class Scheduler:
     maintaining instance state.
     """
 
+    # Event lists already read for display, keyed on (timeForecast, minute, connection,
+    # data_version). Writes made in this process call eventsChanged(); data_version catches
+    # commits from other processes, so a stale list is never served.
+    _eventsCache: dict = {}
+
     @staticmethod
     def _calculatePriorityScore(task):
         """
@@ -161,123 +171,147 @@ class Scheduler:
         return priorityScore
 
     @staticmethod
-    def giveEvents(timeForecast):
+    def giveEvents(timeForecast, connector=None):
         """
         Retrieves events from the calendar database within a specified time period.
 
         Args:
             timeForecast (str): Time period to look ahead in format "<number> D"
                                (e.g., "7 D" for 7 days)
+            connector (ConnectDB, optional): Open connection to reuse. A new one is
+                               opened when omitted.
 
         Returns:
             list: List of events where each event is a tuple containing event details
                   (name, description, start_time, end_time)
         """
-        connector = ConnectDB()
+        connector = connector or ConnectDB()
 
-        # Create events table if it doesn't exist
-        table = """ CREATE TABLE IF NOT EXISTS events
-                    (
-                        event         text,
-                        description   text,
-                        unixtimeStart integer,
-                        unixtimeEnd   integer,
-                        task          boolean default 0,
-                        completed     boolean default 0
-                    ); """
-
-        connector.cursor.execute(table)
-        connector.conn.commit()
-
-        currentTime = int(round(time.time(), 0))
+        currentTime = int(time.time())
         timeForecast = timeOut(timeForecast)
 
-        connector.cursor.execute("SELECT * FROM events WHERE unixtimeEnd > ? AND unixtimeStart < ?", (currentTime,
-                                                                                                      (currentTime +
-                                                                                                       timeForecast)))
+        connector.cursor.execute("SELECT event, description, unixtimeStart, unixtimeEnd FROM events "
+                                 "WHERE unixtimeEnd > ? AND unixtimeStart < ? "
+                                 "ORDER BY unixtimeStart", (currentTime, (currentTime + timeForecast)))
         events = connector.cursor.fetchall()
 
         return events
 
     @staticmethod
-    def _giveTasks():
+    def _giveBusyTimes(timeForecast, connector):
         """
-        Retrieves all unscheduled tasks from the calendar database.
+        Streams the (start, end) times of the events within a time period.
+
+        The scheduler only needs event times, so this skips the name and description
+        columns giveEvents reads for display, and hands back its own cursor to be
+        consumed lazily instead of building a list.
+
+        Args:
+            timeForecast (str): Time period to look ahead in format "<number> D"
+            connector (ConnectDB): Open connection to read from
 
         Returns:
-            list: List of unscheduled tasks where each task is a tuple containing task details
-                  (name, description, urgency, due_date, scheduled_status)
+            sqlite3.Cursor: Iterator of (start_time, end_time) tuples ordered by start time
+        """
+        currentTime = int(time.time())
+
+        return connector.conn.execute("SELECT unixtimeStart, unixtimeEnd FROM events "
+                                      "WHERE unixtimeEnd > ? AND unixtimeStart < ? "
+                                      "ORDER BY unixtimeStart", (currentTime, currentTime + timeOut(timeForecast)))
+
+    @staticmethod
+    def giveCachedEvents(timeForecast):
+        """
+        Same as giveEvents, but reuses the result of an identical call made in the same minute.
+
+        Meant for display paths that may be hit repeatedly; the scheduler itself always
+        reads fresh rows through giveEvents.
+
+        Writes made through this process call eventsChanged(). Commits made by another
+        process, such as a second copy of the bot, are caught by SQLite's data_version,
+        which changes for every commit on another connection, so they are never
+        served from the cache either.
+
+        Args:
+            timeForecast (str): Time period to look ahead in format "<number> D"
+
+        Returns:
+            list: Event tuples (name, description, start_time, end_time). Callers must not modify it.
         """
         connector = ConnectDB()
 
-        # Create tasks table if it doesn't exist
-        table = """ CREATE TABLE IF NOT EXISTS tasks
-                    (
-                        task      text,
-                        unixtime  integer,
-                        urgency   integer,
-                        scheduled boolean default 0,
-                        dueDate   integer,
-                        completed boolean default 0
-                    ); """
+        # data_version is only comparable on the connection that read it, so that is part of the key
+        dataVersion = connector.conn.execute("PRAGMA data_version").fetchone()[0]
+        key = (timeForecast, int(time.time()) // 60, id(connector.conn), dataVersion)
+        events = Scheduler._eventsCache.get(key)
 
-        connector.cursor.execute(table)
-        connector.conn.commit()
+        if events is None:
+            # Entries from earlier minutes or versions can never be hit again
+            Scheduler._eventsCache.clear()
+            events = Scheduler._eventsCache[key] = Scheduler.giveEvents(timeForecast, connector)
 
-        connector.cursor.execute("SELECT * FROM tasks WHERE scheduled = 0 AND completed = 0;")
-        tasks = connector.cursor.fetchall()
+        return events
+
+    @staticmethod
+    def eventsChanged():
+        """
+        Drop every cached event list. Call after any write to the events table.
+        """
+        Scheduler._eventsCache.clear()
+
+    @staticmethod
+    def _giveTasks(connector=None):
+        """
+        Retrieves all unscheduled tasks from the calendar database.
+
+        Args:
+            connector (ConnectDB, optional): Open connection to reuse
+
+        Returns:
+            list: List of unscheduled tasks where each task is a dict with 'iD', 'dueDate',
+                  'urgency', 'taskTime' and 'priorityScore' keys
+        """
+        connector = connector or ConnectDB()
+
+        tasks = connector.cursor.execute("SELECT task, unixtime, urgency, dueDate FROM tasks "
+                                         "WHERE scheduled = 0 AND completed = 0 "
+                                         "ORDER BY urgency DESC, dueDate;")
 
         taskList = []
-        for task in tasks:
-            taskDict = {'iD': task[0],
-                        'dueDate': task[4],
-                        'urgency': task[2],
-                        'taskTime': task[1],
+        for iD, taskTime, urgency, dueDate in tasks:
+            taskDict = {'iD': iD,
+                        'dueDate': dueDate,
+                        'urgency': urgency,
+                        'taskTime': taskTime,
                         }
 
-            priorityScore = Scheduler._calculatePriorityScore(taskDict)
-            taskDict.update({'priorityScore': priorityScore})
+            taskDict['priorityScore'] = Scheduler._calculatePriorityScore(taskDict)
             taskList.append(taskDict)
 
         return taskList
 
     @staticmethod
-    def _giveBlocks():
-        currentTime = int(round(time.time(), 0))
+    def _giveBlocks(connector=None):
+        currentTime = int(time.time())
         weekSecDelta = deltaToStartOfWeek(currentTime)
         startOfWeek = currentTime - weekSecDelta
 
-        connector = ConnectDB()
-
-        # Create blocks table if it doesn't exist
-        table = """ CREATE TABLE IF NOT EXISTS blocks
-                    (
-                        timeStart integer,
-                        timeEnd   integer
-                    ); """
-
-        connector.cursor.execute(table)
-        connector.conn.commit()
-
-        tupleBlocks = connector.cursor.execute("SELECT * FROM blocks WHERE timeEnd > ?", (weekSecDelta,))
-
-        blocks = []
+        connector = connector or ConnectDB()
 
-        for bloc in tupleBlocks:
-            bloc = list(bloc)
-            bloc[0] = bloc[0] + startOfWeek
-            bloc[1] = bloc[1] + startOfWeek
-            blocks.append(bloc)
+        # Blocks are stored relative to the start of the week; SQLite shifts them to this week
+        blocks = connector.cursor.execute("SELECT timeStart + ?, timeEnd + ? FROM blocks WHERE timeEnd > ? "
+                                          "ORDER BY timeStart", (startOfWeek, startOfWeek, weekSecDelta)).fetchall()
 
         return blocks
 
     @staticmethod
-    def _getSchedulingData(timeForecast):
+    def _getSchedulingData(timeForecast, connector=None):
         """
         Retrieves and prepares data needed for scheduling tasks.
 
         Args:
             timeForecast (str): Time period for scheduling in format "<number> D"
+            connector (ConnectDB, optional): Open connection shared by the three reads
 
         Returns:
             tuple: (tasks, blocks) where:
@@ -285,25 +319,20 @@ class Scheduler:
                 - blocks: Combined list of time blocks and events sorted chronologically
         """
 
-        tasks = Scheduler._giveTasks()
-        events = Scheduler.giveEvents(timeForecast)
-        blocks = Scheduler._giveBlocks()
+        connector = connector or ConnectDB()
 
-        # Sort tasks by urgency
-        tasks.sort(key=lambda x: x['priorityScore'], reverse=True)
+        tasks = Scheduler._giveTasks(connector)
+        blocks = Scheduler._giveBlocks(connector)
+        busyTimes = Scheduler._giveBusyTimes(timeForecast, connector)
 
-        # Combine events with blocks
-        for event in events:
-            event = list(event)
-            # Remove name and description fields
-            event.remove(event[0])
-            event.remove(event[0])
-            event.remove(event[2])
-            event.remove(event[2])
-            blocks.append(event)
+        # Sort tasks by priority score. The score depends on the current time, so it can't
+        # be sorted in SQL, but the sort is stable: equal scores keep the urgency/due date
+        # order the query returned them in
+        tasks.sort(key=itemgetter('priorityScore'), reverse=True)
 
-        # Sort blocks chronologically
-        blocks.sort(key=lambda x: x[0])
+        # Combine event times with blocks. Both arrive ordered by start time, so a merge
+        # keeps them chronological while reading the event rows straight off the cursor.
+        blocks = list(heapq.merge(blocks, busyTimes))
 
         return tasks, blocks
 
@@ -313,45 +342,41 @@ class Scheduler:
         Identifies available time slots between blocks.
 
         Args:
-            blocks (list): List of time blocks sorted chronologically
+            blocks (list): (start, end) tuples of time blocks sorted chronologically
 
         Returns:
-            list: List of available time slots as tuples (duration, (start_time, end_time))
+            list: List of available time slots as flat tuples (duration, start_time, end_time)
         """
-        availableTime = []
-
-        for n in range(len(blocks)):
-            if n != (len(blocks)-1):
-                # Calculate time between current block end and next block start
-                delta = blocks[n+1][0] - blocks[n][1]
-                if delta > 600:
-                    # Create time slot with 5-minute buffers on each end
-                    timeslot = {'blockTime': delta-600, 'blockStart': blocks[n][1]+300, 'blockEnd': blocks[n+1][0]-300}
-                    availableTime.append(timeslot)
-            else:
-                continue
+        # Time is busy up to the latest end seen so far, not just the previous block's end,
+        # since an event may sit entirely inside a longer block
+        busyUntil = itertools.accumulate((end for _, end in blocks), max)
+
+        # Pair that with the start of the next block and keep gaps longer than 10 minutes,
+        # trimmed by a 5-minute buffer on each end
+        availableTime = [(gap - 600, end + 300, nextStart - 300)
+                         for end, (nextStart, _) in zip(busyUntil, blocks[1:])
+                         if (gap := nextStart - end) > 600]
 
         return availableTime
 
     @staticmethod
-    def _assignTasksToSlots(tasks, availableTime):
+    def _assignTasksToSlots(tasks, availableTime, connector):
         """
         Assigns tasks to available time slots based on task urgency and time slot availability.
 
-        The function iterates through tasks (sorted by urgency) and available time slots,
-        scheduling each task in the first available slot that has enough time for the task.
-        When a task is scheduled, the time slot is removed from the available slots to prevent
-        double booking.
+        Tasks are taken in priority order and each one goes into the smallest slot that
+        is longer than the task, found by binary search over the slots sorted by length.
+        The time used, plus a 5-minute buffer, is cut from the front of the slot and
+        whatever is left goes back into the sorted list, preventing double booking while
+        keeping longer slots free for longer tasks.
 
         Args:
-            tasks (list): List of tasks sorted by urgency. Each task is a tuple containing:
-                         - [0]: Duration needed for the task (in seconds)
-                         - [1]: Priority level
-                         - [2]: Urgency value
-                         - [4]: Task ID or identifier
-            availableTime (list): List of available time slots. Each slot is a tuple containing:
-                                 - [0]: Duration of the slot (in seconds)
-                                 - [1]: Tuple of (start_time, end_time) in unix timestamp format
+            tasks (list): Task dicts sorted by priority, each containing 'iD', 'taskTime',
+                         'dueDate' and 'urgency'
+            availableTime (list): (duration, start_time, end_time) slot tuples from
+                                 _findAvailableTimeSlots
+            connector (ConnectDB): Open connection to write through. The writes join its
+                                   current transaction; committing is left to the caller
 
         Side Effects:
             - Adds events to the calendar database for each scheduled task
@@ -361,33 +386,54 @@ class Scheduler:
             list: List of scheduled tasks that were successfully assigned to time slots
         """
         scheduledTasks = []
+        eventRows = []
+        scheduledNames = []
 
-        connector = ConnectDB()
+        # (length, start) pairs, so bisect finds the shortest slot first and ties go to the earliest
+        slots = sorted(slot[:2] for slot in availableTime)
 
-        for i in range(len(tasks)):
-            for j in range(len(availableTime)):
+        # Bound once, since they are looked up for every task
+        findSlot = bisect.bisect_right
+        returnSlot = bisect.insort
 
-                if availableTime[j]['blockTime'] > tasks[i]['taskTime']:
+        for task in tasks:
+            if not slots:
+                break
+
+            iD = task['iD']
+            taskTime = task['taskTime']
 
-                    taskStart = availableTime[j]['blockStart']
-                    taskEnd = availableTime[j]['blockEnd'] + tasks[i]['taskTime']
+            # First slot strictly longer than the task
+            index = findSlot(slots, (taskTime, math.inf))
+            if index == len(slots):
+                continue
 
-                    connector.cursor.execute("INSERT INTO events VALUES (?,?,?,?,?,?)",
-                                             (tasks[i]['iD'],
-                                              f"""Due on {toShortHumanTime(tasks[i]['dueDate'])} at 
-                                              {toHumanHour(tasks[i]['dueDate'])}. 
-                                              Level {tasks[i]['urgency']} urgency""",
-                                              taskStart,
-                                              taskEnd,
-                                              1, 0,))
-                    connector.cursor.execute("UPDATE tasks SET scheduled = 1 WHERE task=?", (tasks[i]['iD'],))
+            slotTime, taskStart = slots.pop(index)
+            taskEnd = taskStart + taskTime
 
-                    scheduledTasks.append(tasks[i])
-                    # Remove this time slot from available slots to avoid double booking
-                    availableTime[j]['blockStart'] = availableTime[j]['blockStart'] + tasks[i]['taskTime'] + 300
-                    break
+            # Only built for tasks that actually got a slot
+            description = (f"Due on {toShortHumanTime(task['dueDate'])} at {toHumanHour(task['dueDate'])}. "
+                           f"Level {task['urgency']} urgency")
 
-        connector.conn.commit()
+            eventRows.append((iD, description, taskStart, taskEnd, iD, 1, 0))
+            scheduledNames.append((iD,))
+            scheduledTasks.append(task)
+
+            # Put the rest of the slot back, after a 5-minute buffer
+            remaining = slotTime - taskTime - 300
+            if remaining > 0:
+                returnSlot(slots, (remaining, taskEnd + 300))
+
+        if not scheduledTasks:
+            return scheduledTasks
+
+        # Write every assignment with one statement per table instead of one per task
+        cursor = connector.cursor
+        cursor.executemany("INSERT INTO events "
+                           "(event, description, unixtimeStart, unixtimeEnd, summary, task, completed) "
+                           "VALUES (?,?,?,?,?,?,?)", eventRows)
+        cursor.executemany("UPDATE tasks SET scheduled = 1 WHERE task=?", scheduledNames)
+        Scheduler.eventsChanged()
 
         return scheduledTasks
 
@@ -431,11 +477,21 @@ class Scheduler:
             - Each slot has 5-minute buffers on both ends for transitions
             - Tasks are scheduled in the database as a side effect
         """
-        # Step 1: Get tasks and blocks data
-        tasks, blocks = Scheduler._getSchedulingData(timeForecast)
+        # One connection serves every read and write of the run, so each statement is
+        # prepared once in its statement cache instead of on a fresh connection
+        connector = ConnectDB()
+
+        # Run the reads and the writes as one transaction, holding the write lock from the
+        # start so no other writer can change tasks or events in between. This is the only
+        # commit of the run; the connection is shared, so a failure rolls everything back.
+        with connector.conn:
+            connector.cursor.execute("BEGIN IMMEDIATE")
+
+            # Step 1: Get tasks and blocks data
+            tasks, blocks = Scheduler._getSchedulingData(timeForecast, connector)
 
-        # Step 2: Find available time slots
-        availableTime = Scheduler._findAvailableTimeSlots(blocks)
+            # Step 2: Find available time slots
+            availableTime = Scheduler._findAvailableTimeSlots(blocks)
 
-        # Step 3: Assign tasks to available slots
-        Scheduler._assignTasksToSlots(tasks, availableTime)
+            # Step 3: Assign tasks to available slots
+            Scheduler._assignTasksToSlots(tasks, availableTime, connector)
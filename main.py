@@ -21,7 +21,6 @@ For detailed command reference, see docs/README.md or docs/API.md
 """
 from userInteraction.parsing.tokenAction import TokenFactory
 from userInteraction.parsing.tokenize import CommandTokenizer
-from utils.dbUtils import ConnectDB
 
 
 def main():
@@ -54,9 +53,6 @@ def main():
             factory = TokenFactory(tokened.tokenObject)
             result = factory.doToken()
 
-            connector = ConnectDB()
-            connector.conn.close()
-
             # Display results - handle both single strings and lists
             if isinstance(result, list):
                 for res in result:
@@ -1,15 +1,22 @@
 import os
 import functools
+import threading
 import unittest
 
+# Number of wrapped calls currently running. LIFEORGS_TESTING is set by the outermost
+# one and removed when the last one returns, so nested wraps (a decorated helper such as
+# makeTestDB called from a decorated test) neither rewrite it nor clear it too early.
+_testDepth = 0
+_testDepthLock = threading.Lock()
+
 
 def setTestEnv(target=None):
     def decorator(target):
         if isinstance(target, type) and issubclass(target, unittest.TestCase):
-            # It's a class - wrap all test methods
-            for attr_name in dir(target):
-                attr = getattr(target, attr_name)
-                if callable(attr) and attr_name.startswith('test'):
+            # It's a class - wrap all test methods. Only the class's own namespace is
+            # scanned; the hundreds of attributes inherited from TestCase never hold tests
+            for attr_name, attr in list(vars(target).items()):
+                if attr_name.startswith('test') and callable(attr):
                     wrapped_method = _wrap_test_method(attr)
                     setattr(target, attr_name, wrapped_method)
             return target
@@ -20,12 +27,19 @@ def setTestEnv(target=None):
     def _wrap_test_method(func):
         @functools.wraps(func)
         def wrapper_setTestEnv(*args, **kwargs):
-            os.environ['LIFEORGS_TESTING'] = 'true'
+            global _testDepth
+            with _testDepthLock:
+                if _testDepth == 0:
+                    os.environ['LIFEORGS_TESTING'] = 'true'
+                _testDepth += 1
             try:
                 result = func(*args, **kwargs)
                 return result
             finally:
-                os.environ.pop('LIFEORGS_TESTING', None)
+                with _testDepthLock:
+                    _testDepth -= 1
+                    if _testDepth == 0:
+                        os.environ.pop('LIFEORGS_TESTING', None)
 
         return wrapper_setTestEnv
 
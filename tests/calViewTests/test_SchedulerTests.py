@@ -0,0 +1,112 @@
+import time
+import unittest
+
+from calendarORGS.eventModifiers.tokenAdd import TokenAdd
+from calendarORGS.eventModifiers.tokenModify import TokenModify
+from calendarORGS.eventModifiers.tokenRemove import TokenRemove
+from calendarORGS.scheduling.eventScheduler import Scheduler
+from tests.TestUtils.testEnv import setTestEnv
+from userInteraction.parsing.tokenize import Tokens
+from utils.dbUtils import ConnectDB
+
+
+class FindAvailableTimeSlotsTests(unittest.TestCase):
+    def test_eventInsideBlock(self):
+        # The event ends before the block does, so the gap starts at the block's end
+        blocks = [(0, 10000), (2000, 3000), (20000, 30000)]
+        self.assertEqual(Scheduler._findAvailableTimeSlots(blocks), [(9400, 10300, 19700)])
+
+    def test_eventStraddlesBlockEnd(self):
+        # The event runs past the end of the block, so the gap starts at the event's end
+        blocks = [(0, 10000), (9000, 12000), (20000, 30000)]
+        self.assertEqual(Scheduler._findAvailableTimeSlots(blocks), [(7400, 12300, 19700)])
+
+    def test_backToBackEvents(self):
+        # No time between touching events; only the gap after the last one is free
+        blocks = [(0, 1000), (1000, 2000), (2000, 3000), (10000, 11000)]
+        self.assertEqual(Scheduler._findAvailableTimeSlots(blocks), [(6400, 3300, 9700)])
+
+    def test_shortGapIgnored(self):
+        # Gaps of 10 minutes or less are left alone
+        self.assertEqual(Scheduler._findAvailableTimeSlots([(0, 1000), (1600, 2000)]), [])
+
+
+@setTestEnv
+class AssignTasksToSlotsTests(unittest.TestCase):
+    # Two free slots, as (duration, start, end), and the tasks in priority order
+    slots = [(3600, 1000000, 1003600), (7200, 2000000, 2007200)]
+    tasks = [('First', 3000), ('Second', 1800), ('Third', 1200), ('TooLong', 5000), ('Short', 200)]
+
+    @setTestEnv
+    def setUp(self):
+        self.connector = ConnectDB()
+        with self.connector.conn:
+            self.connector.cursor.execute("DELETE FROM events")
+            self.connector.cursor.execute("DELETE FROM tasks")
+            self.connector.cursor.executemany("INSERT INTO tasks (task, unixtime, urgency, scheduled, dueDate) "
+                                              "VALUES (?,?,3,0,3000000)", self.tasks)
+
+    def tearDown(self):
+        self.connector.conn.rollback()
+
+    def test_assignTasksToSlots(self):
+        taskDicts = [{'iD': iD, 'taskTime': taskTime, 'dueDate': 3000000, 'urgency': 3}
+                     for iD, taskTime in self.tasks]
+
+        scheduled = Scheduler._assignTasksToSlots(taskDicts, self.slots, self.connector)
+        self.assertEqual([task['iD'] for task in scheduled], ['First', 'Second', 'Third', 'Short'])
+
+        events = {event: (start, end) for event, start, end in
+                  self.connector.conn.execute("SELECT event, unixtimeStart, unixtimeEnd FROM events")}
+
+        # Each event lasts exactly as long as its task
+        for iD, taskTime in self.tasks:
+            if iD in events:
+                self.assertEqual(events[iD][1] - events[iD][0], taskTime)
+
+        # Best fit: the 3000 s task takes the 3600 s slot, leaving the 7200 s one for the next
+        self.assertEqual(events['First'][0], 1000000)
+        self.assertEqual(events['Second'][0], 2000000)
+        # What is left of a slot is reused after a 5-minute buffer
+        self.assertEqual(events['Third'][0], events['Second'][1] + 300)
+        self.assertEqual(events['Short'][0], events['First'][1] + 300)
+
+        # Nothing overlaps, and every event stays inside its slot
+        ordered = sorted(events.values())
+        for (_, end), (nextStart, _) in zip(ordered, ordered[1:]):
+            self.assertLessEqual(end, nextStart)
+        for start, end in ordered:
+            self.assertTrue(any(slotStart <= start and end <= slotEnd for _, slotStart, slotEnd in self.slots))
+
+        # Only the placed tasks are marked as scheduled
+        unscheduled = self.connector.conn.execute("SELECT task FROM tasks WHERE scheduled = 0").fetchall()
+        self.assertEqual(unscheduled, [('TooLong',)])
+
+
+@setTestEnv
+class GiveCachedEventsTests(unittest.TestCase):
+    @setTestEnv
+    def setUp(self):
+        conn = ConnectDB().conn
+        with conn:
+            conn.execute("DELETE FROM events")
+        Scheduler.eventsChanged()
+
+    def test_writesInvalidateCache(self):
+        self.assertEqual(Scheduler.giveCachedEvents("7 D"), [])
+
+        start = int(time.time()) + 3600
+        TokenAdd(Tokens('EVENT', 'ADD', numID='Meeting', iD='Meeting', description='Planning',
+                        startTime=start, endTime=start + 1800)).addEvent()
+        self.assertEqual(Scheduler.giveCachedEvents("7 D"), [('Meeting', 'Planning', start, start + 1800)])
+
+        TokenModify(Tokens('EVENT', 'MODIFY', iD='Meeting', modVerb='description',
+                           modContext='Retro')).modifyEvent()
+        self.assertEqual(Scheduler.giveCachedEvents("7 D"), [('Meeting', 'Retro', start, start + 1800)])
+
+        TokenRemove(Tokens('EVENT', 'REMOVE', iD='Meeting')).removeEvent()
+        self.assertEqual(Scheduler.giveCachedEvents("7 D"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
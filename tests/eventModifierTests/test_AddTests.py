@@ -0,0 +1,62 @@
+import unittest
+
+from calendarORGS.eventModifiers.tokenAdd import TokenAdd
+from tests.TestUtils.testEnv import setTestEnv
+from userInteraction.parsing.tokenize import Tokens
+from utils.dbUtils import ConnectDB
+
+
+def _taskTokens(name):
+    return Tokens('TASK', 'ADD', iD=name, taskTime=3600, urgency=3, dueDate=1752084000.0)
+
+
+@setTestEnv
+class AddTaskTests(unittest.TestCase):
+    @setTestEnv
+    def setUp(self):
+        self.conn = ConnectDB().conn
+        with self.conn:
+            self.conn.execute("DELETE FROM tasks")
+
+    def _taskNames(self):
+        return [row[0] for row in self.conn.execute("SELECT task FROM tasks ORDER BY task")]
+
+    def test_addTaskRejectsOpenDuplicate(self):
+        TokenAdd(_taskTokens('Essay')).addTask()
+
+        # addTask goes through the same open-task check as addTasks
+        with self.assertRaisesRegex(Exception, "Essay already exists"):
+            TokenAdd(_taskTokens('Essay')).addTask()
+        self.assertEqual(self._taskNames(), ['Essay'])
+
+    def test_addTaskAllowsNameOfCompletedTask(self):
+        TokenAdd(_taskTokens('Essay')).addTask()
+        with self.conn:
+            self.conn.execute("UPDATE tasks SET completed = 1")
+
+        # The index only covers open tasks, so a finished task's name can be reused
+        TokenAdd(_taskTokens('Essay')).addTask()
+        self.assertEqual(self._taskNames(), ['Essay', 'Essay'])
+
+    def test_addTasksRollsBackOnOpenDuplicate(self):
+        TokenAdd(_taskTokens('Essay')).addTask()
+
+        with self.assertRaisesRegex(Exception, "Essay already exists"):
+            TokenAdd.addTasks([_taskTokens('Email'), _taskTokens('Essay'), _taskTokens('Report')])
+
+        # None of the batch is written, and the lock taken by BEGIN IMMEDIATE is released
+        self.assertEqual(self._taskNames(), ['Essay'])
+        self.assertFalse(self.conn.in_transaction)
+
+    def test_addTasksRejectsRepeatsInBatch(self):
+        with self.assertRaisesRegex(Exception, "more than once"):
+            TokenAdd.addTasks([_taskTokens('Email'), _taskTokens('Email')])
+        self.assertEqual(self._taskNames(), [])
+
+    def test_addTasks(self):
+        TokenAdd.addTasks([_taskTokens('Email'), _taskTokens('Essay')])
+        self.assertEqual(self._taskNames(), ['Email', 'Essay'])
+
+
+if __name__ == '__main__':
+    unittest.main()
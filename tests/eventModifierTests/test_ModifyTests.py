@@ -1,124 +1,178 @@
-# import unittest
-#
-# from tests.TestUtils.makeTestDB import TestDBUtils
-# from tests.TestUtils.testEnv import setTestEnv
-# from userInteraction.parsing.tokenize import Tokens
-# from calendarORGS.eventModifiers.tokenModify import TokenModify
-# from utils.dbUtils import ConnectDB
-# from utils.timeUtilitities.timeUtil import TimeConverter
-#
-# @setTestEnv
-# class ModifyTests(unittest.TestCase):
-#
-#     def __init__(self, *args, **kwargs):
-#         super().__init__(*args, **kwargs)
-#
-#         self.tokenEventDisc = Tokens('EVENT',
-#                                      'MODIFY',
-#                                      iD='Doctor Appointment',
-#                                      modVerb='description',
-#                                      modContext='Biannual Doctors Appointment')
-#         self.tokenEventStartTime = Tokens('EVENT',
-#                                           'MODIFY',
-#                                           iD='Doctor Appointment',
-#                                           modVerb='unixtimeStart',
-#                                           modContext=
-#                                           TimeConverter("09/07/2025 14:00").convertToUTC())
-#         self.tokenEventEndTime = Tokens('EVENT',
-#                                         'MODIFY',
-#                                         iD='Doctor Appointment',
-#                                         modVerb='unixtimeEnd',
-#                                         modContext=
-#                                         TimeConverter("09/07/2025 15:00").convertToUTC())
-#         self.tokenTaskTaskTime = Tokens('TASK',
-#                                         'MODIFY',
-#                                         iD='Write Essay',
-#                                         modVerb='unixtime',
-#                                         modContext=9000)
-#         self.tokenTaskUrgency = Tokens('TASK',
-#                                        'MODIFY',
-#                                        iD='Write Essay',
-#                                        modVerb='urgency',
-#                                        modContext=5)
-#         self.tokenTaskDueDate = Tokens('TASK',
-#                                        'MODIFY',
-#                                        iD='Write Essay',
-#                                        modVerb='dueDate',
-#                                        modContext=
-#                                        TimeConverter("09/07/2025 15:00").convertToUTC())
-#         self.tokenTaskScheduled = Tokens('TASK',
-#                                          'MODIFY',
-#                                          iD='Send Email',
-#                                          modVerb='urgency',
-#                                          modContext=5)
-#
-#     def test_modifyEvent(self):
-#         connector = ConnectDB()
-#         TestDBUtils.makeTestDB()
-#
-#         print(f"For tokenEventDisc\n"
-#               f"Expected: modVerb:description modContext:Biannual Doctors Appointment")
-#         modifyEventDiscObj = TokenModify(self.tokenEventDisc)
-#         modifyEventDiscObj.modifyEvent()
-#
-#         print(f"For tokenEventStartTime\n"
-#               f"Expected: modVerb:unixtimeStart modContext:{self.tokenEventStartTime.modContext}")
-#         modifyEventStartTimeObj = TokenModify(self.tokenEventStartTime)
-#         modifyEventStartTimeObj.modifyEvent()
-#
-#         print(f"For tokenEventEndTime\nExpected: "
-#               f"modVerb:unixtimeEnd "
-#               f"modContext:{self.tokenEventEndTime.modContext}")
-#         modifyEventEndTimeObj = TokenModify(self.tokenEventEndTime)
-#         modifyEventEndTimeObj.modifyEvent()
-#
-#         connector.cursor.execute("SELECT description, unixtimeStart, unixtimeEnd FROM events WHERE event=?",
-#                                  (self.tokenEventDisc.iD,))
-#         modifiedDescription = connector.cursor.fetchone()
-#
-#         self.assertEqual(modifiedDescription[0], self.tokenEventDisc.modContext)
-#         self.assertEqual(modifiedDescription[1], self.tokenEventStartTime.modContext)
-#         self.assertEqual(modifiedDescription[2], self.tokenEventEndTime.modContext)
-#
-#     def test_modifyTask(self):
-#         connector = ConnectDB()
-#         TestDBUtils.makeTestDB()
-#
-#         print(f"For tokenTaskTaskTime\nExpected: modVerb: taskTime modContext: {self.tokenTaskTaskTime.modContext} ")
-#         modifyTaskTaskTimeObj = TokenModify(self.tokenTaskTaskTime)
-#         modifyTaskTaskTimeObj.modifyTask()
-#
-#         print(f"For tokenTaskUrgency\nExpected: modVerb: urgency modContext: {self.tokenTaskUrgency.modContext}")
-#         modifyTaskUrgencyObj = TokenModify(self.tokenTaskUrgency)
-#         modifyTaskUrgencyObj.modifyTask()
-#
-#         print(f"For tokenTaskDueDate\nExpected: modVerb: dueDate modContext: {self.tokenTaskDueDate.modContext}")
-#         modifyTaskDueDateObj = TokenModify(self.tokenTaskDueDate)
-#         modifyTaskDueDateObj.modifyTask()
-#
-#         connector.cursor.execute("SELECT unixtime, urgency, dueDate FROM tasks WHERE task=?",
-#                                  (self.tokenTaskTaskTime.iD,))
-#         modifiedTaskTime = connector.cursor.fetchone()
-#
-#         self.assertEqual(modifiedTaskTime[0], self.tokenTaskTaskTime.modContext)
-#         self.assertEqual(modifiedTaskTime[1], self.tokenTaskUrgency.modContext)
-#         self.assertEqual(modifiedTaskTime[2], self.tokenTaskDueDate.modContext)
-#
-#     def test_unscheduleModifiedTask(self):
-#         connector = ConnectDB()
-#         TestDBUtils.makeTestDB()
-#
-#         print(f"")
-#         modifyTaskScheduledObj = TokenModify(self.tokenTaskScheduled)
-#         modifyTaskScheduledObj.modifyTask()
-#
-#         connector.cursor.execute("SELECT * FROM events WHERE event=?", (self.tokenTaskScheduled.iD,))
-#         scheduled = connector.cursor.fetchone()
-#         self.assertEqual(scheduled, None)
-#         connector.cursor.execute("SELECT scheduled FROM tasks WHERE task=?", (self.tokenTaskScheduled.iD,))
-#         scheduled = connector.cursor.fetchone()
-#         self.assertEqual(scheduled[0], 0)
-#
-#
-# if __name__ == '__main__':
-#     unittest.main()
+import sqlite3
+import unittest
+
+from tests.TestUtils.makeTestDB import TestDBUtils
+from tests.TestUtils.testEnv import setTestEnv
+from userInteraction.parsing.tokenize import Tokens
+from calendarORGS.eventModifiers.tokenModify import TokenModify
+from utils.dbUtils import ConnectDB
+from utils.timeUtilitities.timeUtil import TimeConverter
+
+# Names of the rows created by makeTestDB() that these tests modify
+_DOCTOR = 'Doctor Appointment'
+_ESSAY = 'Write Essay'
+_EMAIL = 'Send Email'
+
+@setTestEnv
+class ModifyTests(unittest.TestCase):
+
+    @classmethod
+    @setTestEnv
+    def setUpClass(cls):
+        # The tokens are the same for every test, so they are built once per class.
+        # Test mode has to be on here too, since the timestamps use the test timezone
+        startTime = TimeConverter("09/07/2025 14:00").convertToUTC()
+        endTime = TimeConverter("09/07/2025 15:00").convertToUTC()
+
+        cls.tokenEventDisc = Tokens('EVENT',
+                                    'MODIFY',
+                                    iD=_DOCTOR,
+                                    modVerb='description',
+                                    modContext='Biannual Doctors Appointment')
+        cls.tokenEventStartTime = Tokens('EVENT',
+                                         'MODIFY',
+                                         iD=_DOCTOR,
+                                         modVerb='unixtimeStart',
+                                         modContext=startTime)
+        cls.tokenEventEndTime = Tokens('EVENT',
+                                       'MODIFY',
+                                       iD=_DOCTOR,
+                                       modVerb='unixtimeEnd',
+                                       modContext=endTime)
+        cls.tokenTaskTaskTime = Tokens('TASK',
+                                       'MODIFY',
+                                       iD=_ESSAY,
+                                       modVerb='unixtime',
+                                       modContext=9000)
+        cls.tokenTaskUrgency = Tokens('TASK',
+                                      'MODIFY',
+                                      iD=_ESSAY,
+                                      modVerb='urgency',
+                                      modContext=5)
+        cls.tokenTaskDueDate = Tokens('TASK',
+                                      'MODIFY',
+                                      iD=_ESSAY,
+                                      modVerb='dueDate',
+                                      modContext=endTime)
+        cls.tokenTaskScheduled = Tokens('TASK',
+                                        'MODIFY',
+                                        iD=_EMAIL,
+                                        modVerb='urgency',
+                                        modContext=5)
+
+        # Build the test database once and keep an in-memory copy of its pages. A
+        # savepoint cannot be used to undo each test, since the code under test commits
+        # on the same per-thread connection, which would release it
+        TestDBUtils.makeTestDB()
+        cls.snapshot = sqlite3.connect(':memory:')
+        ConnectDB().conn.backup(cls.snapshot)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.snapshot.close()
+
+    @setTestEnv
+    def setUp(self):
+        # Copy the pristine pages back over the test database instead of rebuilding it
+        self.snapshot.backup(ConnectDB().conn)
+
+    def test_setUpRestoresFixture(self):
+        connector = ConnectDB()
+        query = "SELECT description FROM events WHERE event=?"
+
+        TokenModify(self.tokenEventDisc).modifyEvent()
+        self.assertEqual(connector.cursor.execute(query, (_DOCTOR,)).fetchone()[0], self.tokenEventDisc.modContext)
+
+        # The committed edit is undone by copying the snapshot back
+        self.setUp()
+        self.assertEqual(connector.cursor.execute(query, (_DOCTOR,)).fetchone()[0], 'Annual check-up')
+
+    def test_tokensUseTestTimezone(self):
+        # setUpClass is not covered by the class decorator; without its own setTestEnv
+        # these would be parsed in the production timezone
+        self.assertEqual(self.tokenEventStartTime.modContext, 1752084000.0)
+        self.assertEqual(self.tokenEventEndTime.modContext, 1752087600.0)
+
+    def test_modifyEvent(self):
+        connector = ConnectDB()
+
+        modifyEventDiscObj = TokenModify(self.tokenEventDisc)
+        modifyEventDiscObj.modifyEvent()
+
+        modifyEventStartTimeObj = TokenModify(self.tokenEventStartTime)
+        modifyEventStartTimeObj.modifyEvent()
+
+        modifyEventEndTimeObj = TokenModify(self.tokenEventEndTime)
+        modifyEventEndTimeObj.modifyEvent()
+
+        connector.cursor.execute("SELECT description, unixtimeStart, unixtimeEnd FROM events WHERE event=?",
+                                 (self.tokenEventDisc.iD,))
+        modifiedDescription = connector.cursor.fetchone()
+
+        self.assertEqual(modifiedDescription[0], self.tokenEventDisc.modContext)
+        self.assertEqual(modifiedDescription[1], self.tokenEventStartTime.modContext)
+        self.assertEqual(modifiedDescription[2], self.tokenEventEndTime.modContext)
+
+    def test_modifyTask(self):
+        connector = ConnectDB()
+
+        modifyTaskTaskTimeObj = TokenModify(self.tokenTaskTaskTime)
+        modifyTaskTaskTimeObj.modifyTask()
+
+        modifyTaskUrgencyObj = TokenModify(self.tokenTaskUrgency)
+        modifyTaskUrgencyObj.modifyTask()
+
+        modifyTaskDueDateObj = TokenModify(self.tokenTaskDueDate)
+        modifyTaskDueDateObj.modifyTask()
+
+        connector.cursor.execute("SELECT unixtime, urgency, dueDate FROM tasks WHERE task=?",
+                                 (self.tokenTaskTaskTime.iD,))
+        modifiedTaskTime = connector.cursor.fetchone()
+
+        self.assertEqual(modifiedTaskTime[0], self.tokenTaskTaskTime.modContext)
+        self.assertEqual(modifiedTaskTime[1], self.tokenTaskUrgency.modContext)
+        self.assertEqual(modifiedTaskTime[2], self.tokenTaskDueDate.modContext)
+
+    def test_modifyUpdatesOneRow(self):
+        conn = ConnectDB().conn
+        otherRows = conn.execute("SELECT * FROM events WHERE event!=?", (_DOCTOR,)).fetchall()
+
+        changesBefore = conn.total_changes
+        TokenModify(self.tokenEventDisc).modifyEvent()
+
+        self.assertEqual(conn.total_changes - changesBefore, 1)
+        self.assertEqual(conn.execute("SELECT * FROM events WHERE event!=?", (_DOCTOR,)).fetchall(), otherRows)
+
+    def test_modifyRejectsUnlistedColumn(self):
+        conn = ConnectDB().conn
+        events = conn.execute("SELECT * FROM events").fetchall()
+        tasks = conn.execute("SELECT * FROM tasks").fetchall()
+
+        # Real columns that MODIFY may not touch, and a name that would rewrite the statement
+        for location, column in (('EVENT', 'event'), ('EVENT', 'task'), ('TASK', 'completed'),
+                                 ('TASK', 'scheduled'), ('EVENT', 'description=NULL, event')):
+            with self.subTest(location=location, column=column):
+                tokens = Tokens(location, 'MODIFY', iD=_DOCTOR, modVerb=column, modContext='x')
+                modify = TokenModify(tokens).modifyEvent if location == 'EVENT' else TokenModify(tokens).modifyTask
+                with self.assertRaisesRegex(Exception, "cannot be modified"):
+                    modify()
+
+        self.assertEqual(conn.execute("SELECT * FROM events").fetchall(), events)
+        self.assertEqual(conn.execute("SELECT * FROM tasks").fetchall(), tasks)
+
+    def test_unscheduleModifiedTask(self):
+        connector = ConnectDB()
+
+        modifyTaskScheduledObj = TokenModify(self.tokenTaskScheduled)
+        modifyTaskScheduledObj.modifyTask()
+
+        connector.cursor.execute("SELECT * FROM events WHERE event=?", (self.tokenTaskScheduled.iD,))
+        scheduled = connector.cursor.fetchone()
+        self.assertEqual(scheduled, None)
+        connector.cursor.execute("SELECT scheduled FROM tasks WHERE task=?", (self.tokenTaskScheduled.iD,))
+        scheduled = connector.cursor.fetchone()
+        self.assertEqual(scheduled[0], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -52,46 +52,27 @@ class ParsingTests(unittest.TestCase):
         Various command strings used as test fixtures for different command types
     """
 
-    def __init__(self, *args, **kwargs):
-        """
-        Initialize the test class with predefined command strings for testing.
-
-        Sets up various command string fixtures that represent typical user input
-        for different command types. These strings are used across multiple test
-        methods to ensure consistent testing.
-
-        Args:
-            *args: Variable length argument list passed to parent class
-            **kwargs: Arbitrary keyword arguments passed to parent class
-        """
-        super().__init__(*args, **kwargs)
+    # Command strings shared by every test; built once with the class rather than per test instance
 
-        # EventObj command test strings
-        self.addEventStr = 'EVENT ADD "meeting" 25/12/2023 14:00 25/12/2023 15:00 "Team meeting"'
-        self.removeEventStr = 'EVENT REMOVE meeting'
-        self.modEventStr = 'EVENT MODIFY "Meeting Name" STARTTIME 25/12/2023 15:00'
+    # EventObj command test strings
+    addEventStr = 'EVENT ADD "meeting" 25/12/2023 14:00 25/12/2023 15:00 "Team meeting"'
+    removeEventStr = 'EVENT REMOVE meeting'
+    modEventStr = 'EVENT MODIFY "Meeting Name" STARTTIME 25/12/2023 15:00'
 
-        # Task command test strings
-        self.addTaskStr = 'TASK ADD "Complete Report" 02:30 25/12/2023 23:59 5'
-        self.removeTaskStr = 'TASK REMOVE "Complete Report"'
-        self.modTaskStr = 'TASK MODIFY "Complete Report" TIME 03:00'
+    # Task command test strings
+    addTaskStr = 'TASK ADD "Complete Report" 02:30 25/12/2023 23:59 5'
+    removeTaskStr = 'TASK REMOVE "Complete Report"'
+    modTaskStr = 'TASK MODIFY "Complete Report" TIME 03:00'
 
-        # Block command test strings
-        self.addBlockStr = 'BLOCK ADD 1 09:00 17:00'
-        self.removeBlockStr = 'BLOCK REMOVE 1 09:00 17:00'
+    # Block command test strings
+    addBlockStr = 'BLOCK ADD 1 09:00 17:00'
+    removeBlockStr = 'BLOCK REMOVE 1 09:00 17:00'
 
-        # Calendar command test strings
-        self.viewCalendarStr = 'CALENDAR VIEW'
-        self.scheduleCalendarStr = 'CALENDAR SCHEDULE'
+    # Calendar command test strings
+    viewCalendarStr = 'CALENDAR VIEW'
+    scheduleCalendarStr = 'CALENDAR SCHEDULE'
 
     def test_commandTokenizerEventAdd(self):
-        print(f"For {self.addEventStr}\nExpected: "
-              f"location:EVENT "
-              f"verb:ADD "
-              f"iD:meeting "
-              f"startTime:1703530800 "
-              f"endTime:1703534400 "
-              f"description:Team meeting")
         tokenizer = CommandTokenizer(self.addEventStr)
         self.assertEqual(tokenizer.location,"EVENT")
         self.assertEqual(tokenizer.verb,"ADD")
@@ -112,18 +93,12 @@ class ParsingTests(unittest.TestCase):
         - verb should be "REMOVE"
         - iD should be the event name (converted to uppercase)
         """
-        print(f"For {self.removeEventStr}\nExpected: location:EVENT verb:REMOVE iD:meeting")
         tokenizer = CommandTokenizer(self.removeEventStr)
         self.assertEqual(tokenizer.location,"EVENT")
         self.assertEqual(tokenizer.verb,"REMOVE")
         self.assertEqual(tokenizer.tokenObject.iD,"MEETING")
 
     def test_commandTokenizerEventModify(self):
-        print(f"For {self.modEventStr}\nExpected: "
-              f"location:EVENT "
-              f"verb:MODIFY, "
-              f"modVerb:STARTTIME, "
-              f"modContext:1703534400.0")
         tokenizer = CommandTokenizer(self.modEventStr)
         self.assertEqual(tokenizer.location,"EVENT")
         self.assertEqual(tokenizer.verb,"MODIFY")
@@ -131,14 +106,6 @@ class ParsingTests(unittest.TestCase):
         self.assertEqual(tokenizer.tokenObject.modContext, 1703534400.0)
 
     def test_commandTokenizerTaskAdd(self):
-        print(f"For {self.addTaskStr}\nExpected: "
-              f"location:TASK "
-              f"verb:ADD "
-              f"iD:Complete Report "
-              f"startTime:838860800 "
-              f"endTime:1297145600 "
-              f"taskTime:3600 "
-              f"taskUrgency:5")
         tokenizer = CommandTokenizer(self.addTaskStr)
         self.assertEqual(tokenizer.location,"TASK")
         self.assertEqual(tokenizer.verb,"ADD")
@@ -159,7 +126,6 @@ class ParsingTests(unittest.TestCase):
         - verb should be "REMOVE"
         - iD should be the task name (preserving original case for quoted strings)
         """
-        print(f"For {self.removeTaskStr}\nExpected: location:TASK verb:REMOVE iD:Complete Report")
         tokenizer = CommandTokenizer(self.removeTaskStr)
         self.assertEqual(tokenizer.location,"TASK")
         self.assertEqual(tokenizer.verb,"REMOVE")
@@ -179,7 +145,6 @@ class ParsingTests(unittest.TestCase):
         - modVerb should be "unixtime" (internal field name for time)
         - modContext should be the time in seconds (10800 = 3 hours)
         """
-        print(f"For {self.modTaskStr}\nExpected: location:TASK verb:MODIFY modVerb:DUEDATE modContext:1703566740.0")
         tokenizer = CommandTokenizer(self.modTaskStr)
         self.assertEqual(tokenizer.location,"TASK")
         self.assertEqual(tokenizer.verb,"MODIFY")
@@ -187,7 +152,6 @@ class ParsingTests(unittest.TestCase):
         self.assertEqual(tokenizer.tokenObject.modContext, 10800.0)
 
     def test_commandTokenizerBlockAdd(self):
-        print(f"For {self.addBlockStr}\nExpected: location:BLOCK verb:ADD startTime:32400 endTime:61200")
         tokenizer = CommandTokenizer(self.addBlockStr)
         self.assertEqual(tokenizer.location,"BLOCK")
         self.assertEqual(tokenizer.verb,"ADD")
@@ -195,20 +159,30 @@ class ParsingTests(unittest.TestCase):
         self.assertEqual(tokenizer.tokenObject.blockEnd,61200)
 
     def test_commandTokenizerBlockRemove(self):
-        print(f"For {self.removeBlockStr}\nExpected: location:BLOCK verb:REMOVE startTime:32400 endTime:61200")
         tokenizer = CommandTokenizer(self.removeBlockStr)
         self.assertEqual(tokenizer.location,"BLOCK")
         self.assertEqual(tokenizer.verb,"REMOVE")
         self.assertEqual(tokenizer.tokenObject.blockStart,32400)
         self.assertEqual(tokenizer.tokenObject.blockEnd,61200)
 
+    def test_smartSplitQuotes(self):
+        self.assertEqual(CommandTokenizer._smartSplit('TASK REMOVE "Complete Report" now'),
+                         ['TASK', 'REMOVE', '"Complete Report"', 'now'])
+        self.assertEqual(CommandTokenizer._smartSplit('TASK REMOVE "Complete Report'),
+                         ['TASK', 'REMOVE', 'Complete', 'Report'])
+        self.assertEqual(CommandTokenizer._smartSplit('TASK REMOVE “Complete Report”'),
+                         ['TASK', 'REMOVE', '“Complete Report”'])
+
+    def test_commandTokenizerCachesTokens(self):
+        first = CommandTokenizer(self.addTaskStr)
+        second = CommandTokenizer(self.addTaskStr)
+        self.assertIs(first.tokenObject, second.tokenObject)
+
     def test_commandTokenizerEventAddFail(self):
-        print("Fail Invalid Command Expected Non Token Object")
         tokenizer = CommandTokenizer('EVENT AD meeting 25/12/2023 14:00 25/12/2023 15:00 "Team meeting"')
         self.assertEqual(tokenizer.tokenObject, None)
 
     def test_commandTokenizerEventAddEmptyString(self):
-        print("Fail Empty String Expected None Token Object")
         tokenizer = CommandTokenizer('')
         self.assertEqual(tokenizer.tokenObject, None)
 
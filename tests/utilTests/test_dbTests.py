@@ -0,0 +1,181 @@
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from calendarORGS.eventModifiers.tokenAdd import TokenAdd
+from tests.TestUtils.makeTestDB import TestDBUtils, _fixtureTimes
+from tests.TestUtils.testEnv import setTestEnv
+from userInteraction.parsing.tokenize import Tokens
+from utils.dbUtils import ConnectDB
+
+
+def _closeCached(dbPath):
+    """Close this thread's cached connection to dbPath and forget its schema check."""
+    connections = getattr(ConnectDB._threadConnections, "connections", {})
+    conn = connections.pop(dbPath, None)
+    if conn is not None:
+        conn.close()
+    ConnectDB._initializedPaths.discard(dbPath)
+
+
+@setTestEnv
+class MakeTestDBTests(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.dbPath = os.path.join(self.tempDir.name, 'worker.db')
+
+    def tearDown(self):
+        _closeCached(self.dbPath)
+        self.tempDir.cleanup()
+
+    def test_makeTestDBExplicitPath(self):
+        # Other test classes on this thread may already have filled the in-memory database
+        memoryConn = ConnectDB().conn
+        memoryEvents = memoryConn.execute("SELECT * FROM events").fetchall()
+
+        TestDBUtils.makeTestDB(dbPath=self.dbPath)
+
+        # Read back through a separate connection, so the rows must have been committed to the file
+        conn = sqlite3.connect(self.dbPath)
+        try:
+            events = conn.execute("SELECT event, unixtimeStart, unixtimeEnd, task FROM events "
+                                  "ORDER BY unixtimeStart").fetchall()
+            tasks = conn.execute("SELECT task, unixtime, urgency, scheduled, dueDate FROM tasks "
+                                 "ORDER BY task").fetchall()
+        finally:
+            conn.close()
+
+        times = _fixtureTimes()
+        self.assertEqual(events, [('Send Email', times['emailStart'], times['emailEnd'], 1),
+                                  ('Doctor Appointment', times['doctorStart'], times['doctorEnd'], 0)])
+        self.assertEqual(tasks, [('Send Email', times['emailEstimate'], 3, 1, times['emailDue']),
+                                 ('Write Essay', times['essayEstimate'], 4, 0, times['essayDue'])])
+
+        # The configured in-memory test database is left alone
+        self.assertEqual(memoryConn.execute("SELECT * FROM events").fetchall(), memoryEvents)
+
+    def test_makeTestDBKeepsSchema(self):
+        TestDBUtils.makeTestDB(dbPath=self.dbPath)
+        TestDBUtils.makeTestDB(dbPath=self.dbPath)
+
+        conn = ConnectDB(self.dbPath).conn
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue({'uniq_tasks_open', 'idx_tasks_unscheduled', 'idx_events_times'} <= indexes)
+
+        # Rebuilding replaces the rows instead of adding to them
+        self.assertEqual(conn.execute("SELECT count(*) FROM tasks").fetchone()[0], 2)
+
+        # Still in WAL mode: makeTestDB must not change the shared connection's pragmas
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+
+    def test_fixtureTimesParsedOnce(self):
+        self.assertIs(_fixtureTimes(), _fixtureTimes())
+        self.assertEqual(_fixtureTimes()['essayEstimate'], 10800)
+        self.assertEqual(_fixtureTimes()['emailEstimate'], 1800)
+
+
+@setTestEnv
+class InitSchemaTests(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.dbPath = os.path.join(self.tempDir.name, 'legacy.db')
+
+    def tearDown(self):
+        _closeCached(self.dbPath)
+        self.tempDir.cleanup()
+
+    def _legacyDB(self, taskRows=()):
+        """Write a database with the six-column tables used before the schema lived in ConnectDB."""
+        conn = sqlite3.connect(self.dbPath)
+        with conn:
+            conn.execute("CREATE TABLE events (event text, description text, unixtimeStart integer, "
+                         "unixtimeEnd integer, task boolean default 0, completed boolean default 0)")
+            conn.execute("CREATE TABLE tasks (task text, unixtime integer, urgency integer, "
+                         "scheduled boolean default 0, dueDate integer, completed boolean default 0)")
+            conn.execute("CREATE TABLE blocks (timeStart integer, timeEnd integer)")
+            conn.execute("INSERT INTO events VALUES ('Doctor Appointment', 'Annual check-up', 100, 200, 0, 0)")
+            conn.executemany("INSERT INTO tasks VALUES (?,?,?,?,?,?)", taskRows)
+        conn.close()
+
+    def test_legacyTablesGetNewColumns(self):
+        self._legacyDB()
+        conn = ConnectDB(self.dbPath).conn
+
+        for table, columns in ConnectDB.tableColumns.items():
+            existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            self.assertEqual(existing, {name for name, _ in columns}, table)
+
+        # Old rows are kept and pick up the new columns' defaults
+        self.assertEqual(conn.execute("SELECT event, location, status, class FROM events").fetchall(),
+                         [('Doctor Appointment', None, 'CONFIRMED', 'PRIVATE')])
+
+    def test_legacyDBGetsIndexesAndVersion(self):
+        self._legacyDB()
+        conn = ConnectDB(self.dbPath).conn
+
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertEqual(indexes, {statement.split(" ON ")[0].split()[-1] for statement in ConnectDB.indexSchemas})
+        self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], ConnectDB.schemaVersion())
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+
+    def test_currentVersionSkipsSchemaSetup(self):
+        self._legacyDB()
+        conn = ConnectDB(self.dbPath).conn
+        with conn:
+            conn.execute("DROP INDEX idx_events_event")
+        _closeCached(self.dbPath)
+
+        # A later process sees the matching user_version and runs no DDL at all
+        conn = ConnectDB(self.dbPath).conn
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertNotIn('idx_events_event', indexes)
+
+    def test_duplicateOpenTasksDontBlockStartup(self):
+        self._legacyDB([('Essay', 3600, 3, 0, 0, 0), ('Essay', 3600, 3, 0, 0, 0)])
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            conn = ConnectDB(self.dbPath).conn
+        self.assertIn("unique index", output.getvalue())
+
+        # Everything but the unique index is in place, and the version is left unset to retry it
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertNotIn('uniq_tasks_open', indexes)
+        self.assertIn('idx_tasks_unscheduled', indexes)
+        self.assertNotEqual(conn.execute("PRAGMA user_version").fetchone()[0], ConnectDB.schemaVersion())
+        self.assertEqual(conn.execute("SELECT count(*) FROM tasks").fetchone()[0], 2)
+
+        # Once the duplicate is gone, the next start adds the index
+        with conn:
+            conn.execute("DELETE FROM tasks WHERE rowid = (SELECT max(rowid) FROM tasks)")
+        _closeCached(self.dbPath)
+
+        conn = ConnectDB(self.dbPath).conn
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertIn('uniq_tasks_open', indexes)
+        self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], ConnectDB.schemaVersion())
+
+
+    def test_addTaskRejectsDuplicateWithoutIndex(self):
+        self._legacyDB([('Essay', 3600, 3, 0, 0, 0), ('Essay', 3600, 3, 0, 0, 0)])
+        with contextlib.redirect_stdout(io.StringIO()):
+            conn = ConnectDB(self.dbPath).conn
+        self.assertNotIn('uniq_tasks_open',
+                         {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")})
+
+        tokens = Tokens('TASK', 'ADD', iD='Email', taskTime=1800, urgency=3, dueDate=0)
+        # TokenAdd opens the configured database, so point that at the legacy file
+        with mock.patch.object(ConnectDB, 'getDBPath', return_value=self.dbPath):
+            TokenAdd(tokens).addTask()
+            with self.assertRaisesRegex(Exception, "Email already exists"):
+                TokenAdd(tokens).addTask()
+
+        self.assertEqual(conn.execute("SELECT count(*) FROM tasks WHERE task = 'Email'").fetchone()[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
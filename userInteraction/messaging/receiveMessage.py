@@ -32,13 +32,12 @@ from userInteraction.messaging.sendMessage import messageUser
 from userInteraction.parsing.tokenAction import TokenFactory
 from userInteraction.parsing.tokenReturn import TokenReturns
 from userInteraction.parsing.tokenize import CommandTokenizer
-from utils.dbUtils import ConnectDB
 
 # Initialize FastAPI application
 app = FastAPI()
 
 # Load verification token from configuration
-verifyToken = SecretCreator().loadSecrets()['VERIFY_TOKEN']
+verifyToken = SecretCreator().loadedSecrets['VERIFY_TOKEN']
 
 @app.get("/webhook")
 def verify(request: Request):
@@ -132,9 +131,6 @@ async def receive(request: Request):
         returns = TokenReturns(tokened.tokenObject).returnMessage
         messageUser(returns)
 
-        connector = ConnectDB()
-        connector.dbCleanup()
-
     except Exception as e:
         # Log extraction errors but continue processing
         print("Could not extract message:", e)
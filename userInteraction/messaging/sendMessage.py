@@ -70,7 +70,7 @@ def sendToUser(data):
         - HTTP 200 status indicates successful message delivery
     """
     # Load configuration settings from config.json
-    config = SecretCreator().loadSecrets()
+    config = SecretCreator().loadedSecrets
 
     # Set up authentication headers for WhatsApp API
     headers = {
@@ -114,7 +114,7 @@ def messageUser(message):
         - Ideal for automated notifications and system messages
     """
     # Load configuration to get default recipient
-    config = SecretCreator().loadSecrets()
+    config = SecretCreator().loadedSecrets
 
     # Format the message for WhatsApp API
     data = getTextMessageInput(config['RECIPIENT_WAID'], message)
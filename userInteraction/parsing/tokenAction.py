@@ -17,6 +17,30 @@ from calendarORGS.eventModifiers.tokenModify import TokenModify
 from calendarORGS.eventModifiers.tokenRemove import TokenRemove
 
 
+def _addEvent(tokens):
+    """Add an event to the database and mirror it to Google Calendar."""
+    TokenAdd(tokens).addEvent()
+    gCalInteract().insertEvent(eventObject=EventObj().returnEventFromDB(tokens.numID))
+
+
+# Command handlers keyed by (verb, location), built once instead of walking nested match blocks per command
+_TOKEN_HANDLERS = {
+    ("ADD", "EVENT"): _addEvent,
+    ("ADD", "TASK"): lambda tokens: TokenAdd(tokens).addTask(),
+    ("ADD", "BLOCK"): lambda tokens: TokenAdd(tokens).addBlock(),
+
+    ("REMOVE", "EVENT"): lambda tokens: TokenRemove(tokens).removeEvent(),
+    ("REMOVE", "TASK"): lambda tokens: TokenRemove(tokens).removeTask(),
+    ("REMOVE", "BLOCK"): lambda tokens: TokenRemove(tokens).removeBlock(),
+
+    ("MODIFY", "EVENT"): lambda tokens: TokenModify(tokens).modifyEvent(),
+    ("MODIFY", "TASK"): lambda tokens: TokenModify(tokens).modifyTask(),
+
+    ("VIEW", "CALENDAR"): lambda tokens: None,
+    ("SCHEDULE", "CALENDAR"): lambda tokens: Scheduler.scheduleTasks(tokens.viewTime),
+}
+
+
 class TokenFactory:
     """
     Factory class for processing tokenized commands and routing them to appropriate handlers.
@@ -43,8 +67,8 @@ class TokenFactory:
         """
         Process the tokenized command and execute the appropriate action.
 
-        This method uses pattern matching to route commands based on the verb and location
-        attributes of the tokens object. It supports the following command patterns:
+        This method looks up the handler for the (verb, location) pair of the tokens object
+        in _TOKEN_HANDLERS. It supports the following command patterns:
 
         - ADD: Creates new events, tasks, or time blocks (includes Google Calendar sync for events)
         - REMOVE: Deletes existing events, tasks, or time blocks  
@@ -64,35 +88,6 @@ class TokenFactory:
                       for database errors, invalid parameters, Google Calendar API errors, etc.
         """
 
-        match self.tokens.verb:
-            case "ADD":
-                match self.tokens.location:
-                    case "EVENT":
-                        TokenAdd.addEvent(TokenAdd(self.tokens))
-                        gCalInteract().insertEvent(eventObject=EventObj().returnEventFromDB(self.tokens.numID))
-                    case "TASK":
-                        TokenAdd.addTask(TokenAdd(self.tokens))
-                    case "BLOCK":
-                        TokenAdd.addBlock(TokenAdd(self.tokens))
-
-            case "REMOVE":
-                match self.tokens.location:
-                    case "EVENT":
-                        TokenRemove.removeEvent(TokenRemove(self.tokens))
-                    case "TASK":
-                        TokenRemove.removeTask(TokenRemove(self.tokens))
-                    case "BLOCK":
-                        TokenRemove.removeBlock(TokenRemove(self.tokens))
-
-            case "MODIFY":
-                match self.tokens.location:
-                    case "EVENT":
-                        TokenModify.modifyEvent(TokenModify(self.tokens))
-                    case "TASK":
-                        TokenModify.modifyTask(TokenModify(self.tokens))
-
-            case "VIEW":
-                pass
-
-            case "SCHEDULE":
-                Scheduler.scheduleTasks(self.tokens.viewTime)
+        handler = _TOKEN_HANDLERS.get((self.tokens.verb, self.tokens.location))
+        if handler is not None:
+            handler(self.tokens)
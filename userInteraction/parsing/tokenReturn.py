@@ -23,7 +23,7 @@ class TokenReturns:
         self.returnMessage = self.returnConfirm()
 
     def returnConfirm(self):
-        siteLink = SecretCreator().loadSecrets()["SITE_LINK"]
+        siteLink = SecretCreator().loadedSecrets["SITE_LINK"]
 
         if self.tokens.location == "BLOCK":
             referenceTime = TimeStarts(generationTime=TimeConverter().currentTime).thisWeek["start"]
@@ -13,18 +13,41 @@ The tokenizer supports complex command parsing including quoted strings, date/ti
 and command validation for events, tasks, and time blocks.
 """
 
+import functools
 import re
+import sys
 
 from utils.idMaker import generateID
+from utils.jsonUtils import Configs
 from utils.timeUtilitities.timeDataClasses import UnixTimePeriods
 from utils.timeUtilitities.timeUtil import TimeConverter, toSeconds
 from dataclasses import dataclass
 from typing import Optional, Union
 
+# Compiled once at import; matches bare words or a quoted run (straight or curly quotes) including its quote marks.
+# It has no capture groups, so findall returns the whole matches as plain strings. The quantifiers are
+# possessive (Python 3.11+) so an unclosed quote fails immediately instead of backtracking through the run
+_SPLIT_PATTERN = re.compile(r'[^\s"\u201c\u201d\u2018\u2019]++|"[^"]*+"|\u201c[^\u201d]*+\u201d|\u2018[^\u2019]*+\u2019')
 
-@dataclass
+# Characters that open a quoted token (straight double, curly double, curly single)
+_QUOTE_OPENERS = frozenset('"\u201c\u2018')
+
+# Seconds from the start of the week to the start of each weekday, Monday first
+_DAY_OFFSETS = tuple(UnixTimePeriods.day * dayIndex for dayIndex in range(7))
+
+# (split command, Tokens object) for previously seen commands, oldest first, bounded to _TOKEN_CACHE_SIZE entries
+_tokenCache: dict = {}
+_TOKEN_CACHE_SIZE = 1024
+
+
+@dataclass(slots=True, frozen=True)
 class Tokens:
-    """A data class that represents parsed command tokens for the lifeORGS application."""
+    """
+    A data class that represents parsed command tokens for the lifeORGS application.
+
+    Instances are slotted and frozen: they are built once by the tokenizer and may be
+    shared between callers through the tokenizer cache, so they must never be mutated.
+    """
     location: str
     verb: str
     numID: Optional[int] = None
@@ -42,6 +65,99 @@ class Tokens:
     viewTime: Optional[str] = None
     physicalLocation: Optional[str] = None
 
+
+@functools.lru_cache(maxsize=4096)
+def _cachedUTC(date, clock, testing):
+    """Memoized TimeConverter conversion; testing is only part of the key since it selects the timezone."""
+    return TimeConverter((date, clock)).convertToUTC()
+
+
+def _contextToUTC(date, clock):
+    """Convert a DD/MM/YYYY date token and HH:MM time token to a UTC Unix timestamp."""
+    return _cachedUTC(date, clock, Configs.isTesting())
+
+
+def _blockOffset(day, clock):
+    """Convert a weekday number (1=Monday) and HH:MM time token to seconds from the start of the week."""
+    dayNum = int(day)
+    if not 1 <= dayNum <= 7:
+        raise Exception("Invalid command. Do it right.")
+
+    return _DAY_OFFSETS[dayNum - 1] + toSeconds(clock)
+
+
+def _buildEventAdd(context):
+    try:
+        physicalLocation = context[6]
+    except IndexError:
+        physicalLocation = 'None'
+
+    return Tokens("EVENT", "ADD",
+                  numID=generateID(context[0]),
+                  iD=context[0],
+                  startTime=_contextToUTC(context[1], context[2]),
+                  endTime=_contextToUTC(context[3], context[4]),
+                  description=context[5],
+                  physicalLocation=physicalLocation)
+
+
+def _buildTaskAdd(context):
+    return Tokens("TASK", "ADD",
+                  iD=context[0],
+                  taskTime=toSeconds(context[1]),
+                  dueDate=_contextToUTC(context[2], context[3]),
+                  urgency=int(context[4]))
+
+
+def _buildBlock(verb):
+    def build(context):
+        return Tokens("BLOCK", verb,
+                      blockStart=_blockOffset(context[0], context[1]),
+                      blockEnd=_blockOffset(context[0], context[2]))
+    return build
+
+
+def _buildRemove(location):
+    def build(context):
+        return Tokens(location, "REMOVE", iD=context[0])
+    return build
+
+
+def _buildModify(location, column, convert):
+    def build(context):
+        return Tokens(location, "MODIFY", iD=context[0], modVerb=column, modContext=convert(context))
+    return build
+
+
+def _buildCalendar(verb):
+    def build(context):
+        return Tokens("CALENDAR", verb, viewTime="14 D")
+    return build
+
+
+# Token builders keyed by (verb, location, modVerb); modVerb is None for everything except MODIFY.
+# MODIFY builders also map the user-facing modVerb to the database column it updates.
+_TOKEN_BUILDERS = {
+    ("ADD", "EVENT", None): _buildEventAdd,
+    ("ADD", "TASK", None): _buildTaskAdd,
+    ("ADD", "BLOCK", None): _buildBlock("ADD"),
+
+    ("REMOVE", "EVENT", None): _buildRemove("EVENT"),
+    ("REMOVE", "TASK", None): _buildRemove("TASK"),
+    ("REMOVE", "BLOCK", None): _buildBlock("REMOVE"),
+
+    ("MODIFY", "EVENT", "DISC"): _buildModify("EVENT", "description", lambda c: c[2]),
+    ("MODIFY", "EVENT", "STARTTIME"): _buildModify("EVENT", "unixtimeStart", lambda c: _contextToUTC(c[2], c[3])),
+    ("MODIFY", "EVENT", "ENDTIME"): _buildModify("EVENT", "unixtimeEnd", lambda c: _contextToUTC(c[2], c[3])),
+    ("MODIFY", "TASK", "DUEDATE"): _buildModify("TASK", "dueDate", lambda c: _contextToUTC(c[2], c[3])),
+    ("MODIFY", "TASK", "TIME"): _buildModify("TASK", "unixtime", lambda c: toSeconds(c[2])),
+    ("MODIFY", "TASK", "URGENCY"): _buildModify("TASK", "urgency", lambda c: int(c[2])),
+
+    ("VIEW", "CALENDAR", None): _buildCalendar("VIEW"),
+    ("SCHEDULE", "CALENDAR", None): _buildCalendar("SCHEDULE"),
+}
+
+
 class CommandTokenizer:
     """
     A command parser and tokenizer for the lifeORGS application.
@@ -73,26 +189,55 @@ class CommandTokenizer:
             #>>> _smartSplit('simple test "with quotes" and "multiple parts"')
             ['simple', 'test', '"with quotes"', 'and', '"multiple parts"']
         """
-        pattern = r'[^\s"\u201c\u201d\u2018\u2019]+|"([^"]*)"|[\u201c]([^\u201d]*)[\u201d]|[\u2018]([^\u2019]*)[\u2019]'
+        if text.isascii():
+            result = []
+            for quoted, segment in CommandTokenizer._asciiSegments(text):
+                if quoted:
+                    result.append(f'"{segment}"')
+                else:
+                    result.extend(segment.split())
 
-        # Create the result list combining non-quoted and quoted parts
-        result = []
-        for item in re.finditer(pattern, text):
-            # Always use the full match to preserve quotation marks
-            result.append(item.group(0))
+            return result
 
-        return result
+        # Whole matches keep their quotation marks
+        return _SPLIT_PATTERN.findall(text)
+
+    @staticmethod
+    def _asciiSegments(text):
+        """
+        Split ASCII text into alternating unquoted and quoted segments.
+
+        ASCII input can only contain straight quotes, so splitting on '"' gives the
+        segments directly without going through the regex engine. Quoted segments
+        are returned without their quotation marks; unquoted segments are returned
+        whole, still containing their whitespace.
+
+        Args:
+            text (str): ASCII input string
+
+        Returns:
+            list: (quoted, segment) pairs in input order
+        """
+        parts = text.split('"')
+        # An even number of parts means the last quote was never closed; like the regex,
+        # drop that quote and treat the trailing segment as ordinary words
+        unclosed = len(parts) % 2 == 0
+        lastPart = len(parts) - 1
+
+        return [(bool(idx % 2) and not (unclosed and idx == lastPart), part) for idx, part in enumerate(parts)]
 
     @staticmethod
     def _parseCommand(command):
         """
-        Parse and execute a command string input by the user.
+        Split a command string input by the user into its words.
 
-        This function takes a command string, splits it into components, and executes
-        the appropriate action based on the command type (EVENT, CALENDAR, TASK, BLOCK).
+        This is the lexing step only: it splits the command into components and
+        uppercases everything outside quotes. The command type (EVENT, CALENDAR, TASK,
+        BLOCK) and verb then select a builder from _TOKEN_BUILDERS in a single lookup,
+        so there is no branching over command kinds here.
 
         Args:
-            command (str): A string containing the command to be parsed and executed.
+            command (str): A string containing the command to be parsed.
                            Expected formats:
 
                            EVENT commands:
@@ -118,7 +263,7 @@ class CommandTokenizer:
                            - BLOCK ADD <day> <start_time> <end_time>
 
         Returns:
-            None
+            list: The command words, uppercased, with quoted strings unquoted and left as typed
 
         Note:
             - Commands are case-insensitive except for quoted strings
@@ -129,24 +274,25 @@ class CommandTokenizer:
             - Quoted strings preserve spaces and are used for descriptions
         """
 
+        # For ASCII commands, uppercase each unquoted run once before splitting it into words
+        # and take quoted runs as they are, so no token needs a second look
+        if command.isascii():
+            splitCommand = []
+            for quoted, segment in CommandTokenizer._asciiSegments(command):
+                if quoted:
+                    splitCommand.append(segment)
+                else:
+                    splitCommand.extend(segment.upper().split())
+
+            return splitCommand
+
         # Split the command string into components using smart splitting to handle quoted strings
         splitCommand = CommandTokenizer._smartSplit(command)
 
-        # Convert all non-quoted strings to uppercase for case-insensitive command processing
-        for n in range(len(splitCommand)):
-            # Check if the string starts with any type of quote (regular or curly)
-            if splitCommand[n][0] not in ['"', '\u201c', '\u2018']:
-                splitCommand[n] = splitCommand[n].upper()
-            else:
-                # Strip quotes (regular double, curly double, or curly single)
-                if splitCommand[n][0] == '"' and splitCommand[n][-1] == '"':
-                    splitCommand[n] = splitCommand[n].strip('"')
-                elif splitCommand[n][0] == '\u201c' and splitCommand[n][-1] == '\u201d':
-                    splitCommand[n] = splitCommand[n][1:-1]  # Remove curly double quotes
-                elif splitCommand[n][0] == '\u2018' and splitCommand[n][-1] == '\u2019':
-                    splitCommand[n] = splitCommand[n][1:-1]  # Remove curly single quotes
-
-        return splitCommand
+        # Convert all non-quoted strings to uppercase for case-insensitive command processing.
+        # _smartSplit only returns a token starting with a quote when it also ends with the
+        # matching closing quote, so stripping the quotes is always a one character slice
+        return [token[1:-1] if token[0] in _QUOTE_OPENERS else token.upper() for token in splitCommand]
 
     @staticmethod
     def _getContext(tokens):
@@ -172,24 +318,15 @@ class CommandTokenizer:
             #>>> _getContext(tokens)
             ['meeting', '25/12/2023', '14:00', '25/12/2023', '15:00', 'Team meeting']
         """
-        context = []
-
-        for token in range(len(tokens)):
-            if token != 0 and token != 1:
-                context.append(tokens[token])
-            else:
-                continue
-
-        return context
+        return tokens[2:]
 
     def _createTokenObject(self):
         """
         Create and populate a Tokens object based on the parsed command.
 
-        This method creates a Tokens object and populates it with the appropriate
-        attributes based on the command location (EVENT, TASK, BLOCK) and verb
-        (ADD, REMOVE, MODIFY). It handles the conversion of date/time strings to
-        Unix timestamps and validates command structure.
+        Looks up the builder for the command's (verb, location, modVerb) combination
+        in _TOKEN_BUILDERS and hands it the command context. Builders handle the
+        conversion of date/time strings to Unix timestamps.
 
         Returns:
             Tokens: A fully populated Tokens object with all relevant attributes
@@ -205,103 +342,40 @@ class CommandTokenizer:
             - For REMOVE commands: Expects [id] for EVENT/TASK, [day, start_time, end_time] for BLOCK
             - For MODIFY commands: Expects [id, mod_verb, ...additional_args]
         """
+        # Interned like location and verb, so every element of the lookup key matches by identity
+        modVerb = sys.intern(self.context[1]) if self.verb == "MODIFY" else None
 
-        tokenObj = Tokens(self.location, self.verb)
-
-        if self.verb == "ADD":
-            if tokenObj.location == "EVENT":
-                tokenObj.numID = generateID(self.context[0])
-                tokenObj.iD = self.context[0]
-                tokenObj.startTime = TimeConverter(f"{self.context[1]} {self.context[2]}").convertToUTC()
-                tokenObj.endTime = TimeConverter(f"{self.context[3]} {self.context[4]}").convertToUTC()
-                tokenObj.description = self.context[5]
-                try:
-                    tokenObj.physicalLocation = self.context[6]
-                except IndexError:
-                    tokenObj.physicalLocation = 'None'
-                return tokenObj
-
-            elif tokenObj.location == "TASK":
-                tokenObj.iD = self.context[0]
-                tokenObj.taskTime = toSeconds(self.context[1])
-                tokenObj.dueDate = TimeConverter(f"{self.context[2]} {self.context[3]}").convertToUTC()
-                tokenObj.urgency = int(self.context[4])
-                return tokenObj
-
-            elif tokenObj.location == "BLOCK":
-                tokenObj.blockStart = (UnixTimePeriods.day * (int(self.context[0]) - 1)) + toSeconds(self.context[1])
-                tokenObj.blockEnd = (UnixTimePeriods.day * (int(self.context[0]) - 1)) + toSeconds(self.context[2])
-                return tokenObj
-
-            else:
-                raise Exception("Invalid command. Do it right.")
+        try:
+            builder = _TOKEN_BUILDERS[(self.verb, self.location, modVerb)]
+        except KeyError:
+            raise Exception("Invalid command. Do it right.")
 
-        elif self.verb == "REMOVE":
-            if tokenObj.location == "EVENT":
-                tokenObj.iD = self.context[0]
-                return tokenObj
+        return builder(self.context)
 
-            elif tokenObj.location == "TASK":
-                tokenObj.iD = self.context[0]
-                return tokenObj
+    def _cachedTokenObject(self, cacheKey):
+        """
+        Build the Tokens object for the parsed command and remember it for identical commands.
 
-            elif tokenObj.location == "BLOCK":
-                tokenObj.blockStart = (UnixTimePeriods.day * (int(self.context[0]) - 1)) + toSeconds(self.context[1])
-                tokenObj.blockEnd = (UnixTimePeriods.day * (int(self.context[0]) - 1)) + toSeconds(self.context[2])
-                return tokenObj
+        Timestamps depend on the configured timezone, which switches with LIFEORGS_TESTING,
+        so the testing flag is part of the cache key. EVENT ADD commands draw a fresh
+        database ID on every call and are therefore never cached.
 
-            else:
-                raise Exception("Invalid command. Do it right.")
-
-        elif self.verb == "MODIFY":
-            tokenObj.iD = self.context[0]
-            tokenObj.modVerb = self.context[1]
-
-            if tokenObj.location == "EVENT":
-                if tokenObj.modVerb == "DISC":
-                    tokenObj.modVerb = "description"
-                    tokenObj.modContext = self.context[2]
-                    return tokenObj
-
-                elif tokenObj.modVerb == "STARTTIME":
-                    tokenObj.modVerb = "unixtimeStart"
-                    tokenObj.modContext = TimeConverter(f"{self.context[2]} {self.context[3]}").convertToUTC()
-                    return tokenObj
-
-                elif tokenObj.modVerb == "ENDTIME":
-                    tokenObj.modVerb = "unixtimeEnd"
-                    tokenObj.modContext = TimeConverter(f"{self.context[2]} {self.context[3]}").convertToUTC()
-                    return tokenObj
-                else:
-                    raise Exception("Invalid command. Do it right.")
-
-            elif tokenObj.location == "TASK":
-                if tokenObj.modVerb == "DUEDATE":
-                    tokenObj.modVerb = "dueDate"
-                    tokenObj.modContext = TimeConverter(f"{self.context[2]} {self.context[3]}").convertToUTC()
-                    return tokenObj
-
-                elif tokenObj.modVerb == "TIME":
-                    tokenObj.modVerb = "unixtime"
-                    tokenObj.modContext = toSeconds(self.context[2])
-                    return tokenObj
-
-                elif tokenObj.modVerb == "URGENCY":
-                    tokenObj.modVerb = "urgency"
-                    tokenObj.modContext = int(self.context[2])
-                    return tokenObj
-                else:
-                    raise Exception("Invalid command. Do it right.")
+        Args:
+            cacheKey (tuple): The raw command string and the testing flag
 
-            else:
-                raise Exception("Invalid command. Do it right.")
+        Returns:
+            Tokens: The populated Tokens object for the command
+        """
+        tokenObj = self._createTokenObject()
 
-        elif self.location == "CALENDAR":
-            tokenObj.viewTime = "14 D"
-            return tokenObj
+        if not (self.location == "EVENT" and self.verb == "ADD"):
+            if len(_tokenCache) >= _TOKEN_CACHE_SIZE:
+                # Evict the oldest entry
+                del _tokenCache[next(iter(_tokenCache))]
+            # The split command is stored too, so a repeat of the command skips parsing entirely
+            _tokenCache[cacheKey] = (tuple(self.tokens), tokenObj)
 
-        else:
-            raise Exception("Invalid command. Do it right.")
+        return tokenObj
 
     def __init__(self, command):
         """
@@ -334,10 +408,23 @@ class CommandTokenizer:
             >>> tokenizer.verb      # 'ADD'
         """
         try:
-            self.tokens = self._parseCommand(command)
+            cacheKey = (command, Configs.isTesting())
+            cached = _tokenCache.get(cacheKey)
+
+            if cached is not None:
+                splitCommand, self.tokenObject = cached
+                self.tokens = list(splitCommand)
+            else:
+                self.tokens = self._parseCommand(command)
+                # Intern location and verb so the handler lookup in TokenFactory.doToken matches keys by identity
+                self.tokens[0] = sys.intern(self.tokens[0])
+                self.tokens[1] = sys.intern(self.tokens[1])
+
             self.location = self.tokens[0]
             self.verb = self.tokens[1]
             self.context = self._getContext(self.tokens)
-            self.tokenObject = self._createTokenObject()
+
+            if cached is None:
+                self.tokenObject = self._cachedTokenObject(cacheKey)
         except:
             self.tokenObject = None
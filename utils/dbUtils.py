@@ -6,14 +6,24 @@ It handles SQLite database connections with automatic path resolution and connec
 
 The module ensures that the database file is always accessed from the correct location,
 regardless of the current working directory, making the application portable and reliable.
+
+Databases run in WAL journal mode with synchronous=NORMAL. Commits no longer wait for
+an fsync of the main database file, only of the WAL on checkpoint, which roughly halves
+write latency. The database can never be corrupted this way, but the last few commits
+before a power loss or OS crash may be rolled back; an application crash loses nothing.
 """
 
 import json
 import os
 import sqlite3
+import threading
+import zlib
 
 from utils.jsonUtils import Configs
 
+# SQLite's name for a private, in-memory database
+MEMORY_DB = ":memory:"
+
 class ConnectDB:
     """
     Database connection manager for the lifeORGS SQLite database.
@@ -27,19 +37,65 @@ class ConnectDB:
         cursor (sqlite3.Cursor): The database cursor for executing SQL commands
     """
 
+    # The single definition of every application table as (column, type/default) pairs.
+    # Columns missing from an existing database are added when it is first opened.
+    tableColumns = {
+        "events": (("event", "text"),
+                   ("description", "text"),
+                   ("unixtimeStart", "integer"),
+                   ("unixtimeEnd", "integer"),
+                   ("location", "text"),
+                   ("summary", "text"),
+                   ("status", "text default 'CONFIRMED'"),
+                   ("class", "text default 'PRIVATE'"),
+                   ("task", "boolean default 0"),
+                   ("completed", "boolean default 0")),
+        "tasks": (("task", "text"),
+                  ("unixtime", "integer"),
+                  ("urgency", "integer"),
+                  ("scheduled", "boolean default 0"),
+                  ("dueDate", "integer"),
+                  ("completed", "boolean default 0")),
+        "blocks": (("timeStart", "integer"),
+                   ("timeEnd", "integer")),
+    }
+
+    # Indexes backing the WHERE and ORDER BY clauses of the application queries
+    indexSchemas = (
+        "CREATE INDEX IF NOT EXISTS idx_events_event ON events(event);",
+        "CREATE INDEX IF NOT EXISTS idx_events_start ON events(unixtimeStart);",
+        "CREATE INDEX IF NOT EXISTS idx_events_times ON events(unixtimeEnd, unixtimeStart);",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_task ON tasks(task);",
+        # Only one open (not completed) task may carry a given name. TokenAdd checks this itself
+        # before inserting; the index guards every other writer
+        "CREATE UNIQUE INDEX IF NOT EXISTS uniq_tasks_open ON tasks(task) WHERE completed = 0;",
+        # Covers only the tasks the scheduler still has to place
+        "CREATE INDEX IF NOT EXISTS idx_tasks_unscheduled ON tasks(urgency) WHERE scheduled = 0 AND completed = 0;",
+        "CREATE INDEX IF NOT EXISTS idx_blocks_range ON blocks(timeStart, timeEnd);",
+    )
+
+    # Database paths whose tables have already been created in this process
+    _initializedPaths: set = set()
+
+    # Open connections of the current thread, keyed by database path, in a .connections dict
+    _threadConnections = threading.local()
+
     @staticmethod
     def getDBPath():
         """
         Returns the absolute path to the calendar database file.
 
         This ensures that the database file is always accessed from the correct location,
-        regardless of the current working directory.
+        regardless of the current working directory. A DATABASE_NAME of ":memory:" (the
+        test configuration) is returned as is, so SQLite keeps that database in memory.
 
         Returns:
-            str: Absolute path to the calendar.db file
+            str: Absolute path to the calendar.db file, or ":memory:"
         """
 
         dbName = Configs().mainConfig['DATABASE_NAME']
+        if dbName == MEMORY_DB:
+            return dbName
 
         # Get the directory of the current file (dbUtils.py)
         currentDir = os.path.dirname(os.path.abspath(__file__))
@@ -57,8 +113,9 @@ class ConnectDB:
         """
         Initialize a SQLite database connection and cursor.
 
-        Creates a connection to the SQLite database at the specified path
-        and returns both the connection and cursor objects for database operations.
+        Creates a connection to the SQLite database at the specified path, applies the
+        per-connection pragmas and returns both the connection and cursor objects for
+        database operations.
 
         Args:
             dbPath (str): The file path to the SQLite database
@@ -69,34 +126,163 @@ class ConnectDB:
                   - cursor (sqlite3.Cursor): The database cursor for executing commands
         """
         conn = sqlite3.connect(dbPath)
+
+        # These settings only last for the connection, so they are applied every time
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        # Read pages straight from a memory map of the file instead of read() calls
+        conn.execute("PRAGMA mmap_size=268435456")
+        # Shrink the WAL file back to 4 MB after checkpoints instead of keeping its largest size
+        conn.execute("PRAGMA journal_size_limit=4194304")
+
         cursor = conn.cursor()
         return conn, cursor
 
-    def __init__(self):
+    @staticmethod
+    def schemaVersion():
+        """
+        Checksum of the table and index definitions, stored as the database user_version.
+
+        Returns:
+            int: A positive 31-bit value that changes whenever the schema definition does
+        """
+        return zlib.crc32(repr((ConnectDB.tableColumns, ConnectDB.indexSchemas)).encode()) & 0x7FFFFFFF
+
+    @staticmethod
+    def initSchema(conn, dbPath):
+        """
+        Create the application tables and indexes the first time a database file is opened.
+
+        Tables that already exist but were created by an older version of the schema
+        get their missing columns added, so every database ends up with the columns
+        listed in tableColumns. Column order may differ between new and migrated
+        databases, so inserts must name their columns.
+
+        This only runs once per database path for the lifetime of the process, so
+        regular reads and writes never pay for parsing DDL or re-checking the schema.
+        A checksum of the schema definition is stored in the file's user_version, so
+        later processes skip the DDL entirely until tableColumns or indexSchemas change.
+
+        A unique index that existing rows violate is skipped with a warning instead of
+        stopping the application from starting. TokenAdd checks for duplicate open
+        tasks itself, so that rule still holds for tasks added while the index is missing.
+
+        Args:
+            conn (sqlite3.Connection): An open connection to the database
+            dbPath (str): The file path the connection was opened on
+        """
+        if dbPath in ConnectDB._initializedPaths:
+            return
+
+        schemaVersion = ConnectDB.schemaVersion()
+        if conn.execute("PRAGMA user_version").fetchone()[0] == schemaVersion:
+            ConnectDB._markInitialized(dbPath)
+            return
+
+        # WAL mode is stored in the database file itself, so setting it once is enough
+        conn.execute("PRAGMA journal_mode=WAL")
+
+        for table, columns in ConnectDB.tableColumns.items():
+            columnDefs = ", ".join(f"{name} {definition}" for name, definition in columns)
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columnDefs})")
+
+            existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            for name, definition in columns:
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
+        schemaComplete = True
+        for statement in ConnectDB.indexSchemas:
+            try:
+                conn.execute(statement)
+            except sqlite3.IntegrityError as error:
+                # A unique index can't be built over rows that already break it, e.g. open
+                # tasks saved twice before uniq_tasks_open existed. The rows are left for the
+                # user to sort out rather than deleted, and the database still opens
+                schemaComplete = False
+                print(f"Warning: {dbPath} has rows that break a unique index ({error}); "
+                      f"it was not created. Remove the duplicates and restart to add it.")
+
+        # Only a complete schema is recorded, so a skipped index is retried on the next start
+        if schemaComplete:
+            conn.execute(f"PRAGMA user_version={schemaVersion}")
+        conn.commit()
+
+        ConnectDB._markInitialized(dbPath)
+
+    @staticmethod
+    def _markInitialized(dbPath):
+        """
+        Remember that a database path no longer needs its schema checked.
+
+        Every connection to ":memory:" opens a separate, empty database, so that
+        path is never remembered and each new in-memory connection gets its tables.
+
+        Args:
+            dbPath (str): The file path the schema was set up on
+        """
+        if dbPath != MEMORY_DB:
+            ConnectDB._initializedPaths.add(dbPath)
+
+    @staticmethod
+    def getConnection(dbPath):
+        """
+        Return the calling thread's connection to a database, opening it on first use.
+
+        Opening a connection means a file open, the per-connection pragmas and an empty
+        statement cache, so each thread keeps one connection per database for its whole
+        lifetime instead of paying for that on every ConnectDB().
+
+        Args:
+            dbPath (str): The file path to the SQLite database
+
+        Returns:
+            sqlite3.Connection: An open connection owned by the current thread
+        """
+        connections = getattr(ConnectDB._threadConnections, "connections", None)
+        if connections is None:
+            connections = ConnectDB._threadConnections.connections = {}
+
+        conn = connections.get(dbPath)
+        if conn is None:
+            conn, _ = ConnectDB.initConnection(dbPath)
+            ConnectDB.initSchema(conn, dbPath)
+            connections[dbPath] = conn
+
+        return conn
+
+    def __init__(self, dbPath=None):
         """
         Initialize the ConnectDB instance with an active database connection.
 
-        Automatically establishes a connection to the calendar database using
-        the resolved database path. The connection and cursor are stored as
-        instance attributes for immediate use.
+        Reuses the current thread's connection to the calendar database (opening it
+        and making sure its tables exist the first time) and gives this instance its
+        own cursor. The connection and cursor are stored as instance attributes for
+        immediate use.
+
+        Args:
+            dbPath (str, optional): Database to connect to instead of the configured
+                                    one, e.g. a per-worker file when tests run in parallel
 
         Attributes set:
             conn (sqlite3.Connection): Active database connection
             cursor (sqlite3.Cursor): Database cursor for SQL operations
         """
-        self.conn, self.cursor = self.initConnection(self.getDBPath())
+        self.conn = self.getConnection(dbPath or self.getDBPath())
+        self.cursor = self.conn.cursor()
 
     def dbCleanup(self):
         """
-        Clean up the database connection by committing changes and closing.
+        Commit pending changes and release this instance's cursor.
 
-        This method ensures that all pending database transactions are committed
-        and the connection is properly closed. Should be called when database
-        operations are complete to prevent connection leaks.
+        The connection itself stays open, since it is shared with every other
+        ConnectDB created on the same thread. Should be called when database
+        operations are complete.
 
         Note:
-            After calling this method, the connection and cursor will no longer
-            be usable and a new ConnectDB instance should be created if needed.
+            After calling this method, the cursor will no longer be usable and a
+            new ConnectDB instance should be created if needed.
         """
         self.conn.commit()
-        self.conn.close()
+        self.cursor.close()
@@ -12,7 +12,7 @@ def generateID(seedStr: str):
             seed = seedStr + str(time.time()) + str(random.randint(0, 1000000))
             eventID = int(hashlib.sha256(seed.encode()).hexdigest()[:10], 16)
 
-            connector.cursor.execute("SELECT event FROM events WHERE event=?", (eventID,))
+            connector.cursor.execute("SELECT 1 FROM events WHERE event=? LIMIT 1", (eventID,))
             row = connector.cursor.fetchone()
             if row is None:
                 return eventID
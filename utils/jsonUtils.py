@@ -72,7 +72,12 @@ class Configs:
             Due to singleton pattern, __init__ may be called multiple times but
             configuration loading is protected against redundant operations.
         """
-        testing = os.getenv('LIFEORGS_TESTING', 'false').lower() == 'true'
+        testing = self.isTesting()
+
+        # Every Configs() call lands here on the shared instance; the files only need
+        # reading again when LIFEORGS_TESTING has switched to the other directory
+        if getattr(self, '_loadedTesting', None) is testing:
+            return
 
         self.configDirPath = Path(getProjRoot()) / "configurations" / "testConfigs" \
             if testing else Path(getProjRoot()) / "configurations"
@@ -82,6 +87,21 @@ class Configs:
 
         (self._loadConfig
          (["config.json", "colorSchemes.json"] if not testing else ["testConfig.json", "testColorSchemes.json"]))
+        self._loadedTesting = testing
+
+    @staticmethod
+    def isTesting() -> bool:
+        """
+        Report whether the test configuration is active.
+
+        The LIFEORGS_TESTING environment variable selects the test configuration
+        directory, so anything derived from configuration values (such as timestamps
+        in the user's timezone) should include this flag in its cache key.
+
+        Returns:
+            bool: True if LIFEORGS_TESTING is set to "true"
+        """
+        return os.getenv('LIFEORGS_TESTING', 'false').lower() == 'true'
 
     def _loadConfig(self, fileNames: list) -> None:
         """
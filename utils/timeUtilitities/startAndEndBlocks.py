@@ -58,6 +58,27 @@ class TimeStarts:
         {'start': 1703462400.0, 'end': 1703548740.0}
     """
 
+    @staticmethod
+    def _splitIntoDays(period):
+        """
+        Splits a period into consecutive days, each from 00:00 to 23:59.
+
+        The number of days is worked out up front, so the boundaries are built in a
+        single pass instead of extending a list until a day runs past the period end.
+
+        Args:
+            period (dict): Dictionary with 'start' and 'end' Unix timestamps
+
+        Returns:
+            tuple: Dictionaries with 'start' and 'end' timestamps for each whole day
+        """
+        start = period["start"]
+        dayCount = int((period["end"] - start + UnixTimePeriods.minute) // UnixTimePeriods.day)
+
+        return tuple({"start": start + UnixTimePeriods.day * dayIndex,
+                      "end": start + UnixTimePeriods.day * (dayIndex + 1) - UnixTimePeriods.minute}
+                     for dayIndex in range(dayCount))
+
     def __init__(self, generationTime=None):
         """
         Initialize TimeStarts with current time in user's timezone.
@@ -77,15 +98,14 @@ class TimeStarts:
         self.thisMonth: dict = {}
         self.daysOfMonth: tuple = ()
 
-        self.dayPointerWeek = TimeConverter(unixtime=self.currentTime).generateTimeDataObj().dayNumInWeek - 1
-        self.dayPointerMonth = TimeConverter(unixtime=self.currentTime).generateTimeDataObj().day - 1
+        currentTimeData = TimeConverter(unixtime=self.currentTime).generateTimeDataObj()
+        self.dayPointerWeek = currentTimeData.dayNumInWeek - 1
+        self.dayPointerMonth = currentTimeData.day - 1
 
-        self.setToday()
-        self.setThisWeek()
+        # Each setDaysOf* method sets its period first (setDaysOfFloatingWeek also sets today),
+        # so calling the period setters separately as well would only repeat the conversions
         self.setDaysOfThisWeek()
-        self.setFloatingWeek()
         self.setDaysOfFloatingWeek()
-        self.setThisMonth()
         self.setDaysOfMonth()
 
     def setToday(self):
@@ -173,22 +193,7 @@ class TimeStarts:
         """
         self.setThisWeek()
 
-        counter = 0
-        startEndList = []
-        breaker = True
-        while breaker:
-
-            startEndDict = {"start": (self.thisWeek["start"] + (UnixTimePeriods.day * counter)),
-                            "end": (self.thisWeek["start"] +
-                                    (UnixTimePeriods.day * (counter + 1)) - UnixTimePeriods.minute)}
-
-            if startEndDict["end"] > self.thisWeek["end"]:
-                breaker = False
-            else:
-                startEndList.append(startEndDict)
-                counter += 1
-
-        self.daysOfThisWeek = tuple(startEndList)
+        self.daysOfThisWeek = self._splitIntoDays(self.thisWeek)
         return self.daysOfThisWeek
 
     def setFloatingWeek(self):
@@ -243,20 +248,7 @@ class TimeStarts:
         """
         self.setFloatingWeek()
 
-        counter = 0
-        startEndList = []
-        breaker = True
-        while breaker:
-            startEndDict = {"start": (self.floatingWeek["start"] + (UnixTimePeriods.day * counter)),
-                            "end": (self.floatingWeek["start"] +
-                                    (UnixTimePeriods.day * (counter + 1)) - UnixTimePeriods.minute)}
-            if startEndDict["end"] > self.floatingWeek["end"]:
-                breaker = False
-            else:
-                startEndList.append(startEndDict)
-                counter += 1
-
-        self.daysOfFloatingWeek = tuple(startEndList)
+        self.daysOfFloatingWeek = self._splitIntoDays(self.floatingWeek)
         return self.daysOfFloatingWeek
 
     def setThisMonth(self):
@@ -305,18 +297,5 @@ class TimeStarts:
     def setDaysOfMonth(self):
         self.setThisMonth()
 
-        counter = 0
-        startEndList = []
-        breaker = True
-        while breaker:
-            startEndDict = {"start": (self.thisMonth["start"] + (UnixTimePeriods.day * counter)),
-                            "end": (self.thisMonth["start"] +
-                                    (UnixTimePeriods.day * (counter + 1)) - UnixTimePeriods.minute)}
-            if startEndDict["end"] > self.thisMonth["end"]:
-                breaker = False
-            else:
-                startEndList.append(startEndDict)
-                counter += 1
-
-        self.daysOfMonth = tuple(startEndList)
+        self.daysOfMonth = self._splitIntoDays(self.thisMonth)
         return self.daysOfMonth
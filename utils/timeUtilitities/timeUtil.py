@@ -26,6 +26,7 @@ Functions:
 - deltaToStartOfWeek: Calculate seconds since start of week
 """
 
+import functools
 import time
 from datetime import datetime, timezone
 from typing import Optional
@@ -33,6 +34,14 @@ from zoneinfo import ZoneInfo
 from utils.jsonUtils import Configs
 from utils.timeUtilitities.timeDataClasses import TimeData
 
+# Month and day names for human-readable formatting, built once rather than on every conversion
+_MONTH_NAMES = ("January", "February", "March",
+                "April", "May", "June",
+                "July", "August", "September",
+                "October", "November", "December")
+_DAY_OF_WEEK_NAMES = ("Monday", "Tuesday", "Wednesday",
+                      "Thursday", "Friday", "Saturday", "Sunday")
+
 
 class TokenizeToDatetime:
     """
@@ -57,10 +66,12 @@ class TokenizeToDatetime:
         Splits a time string into date and time components.
 
         Parses a time string in DD/MM/YYYY HH:MM format and separates
-        the date and time parts into lists for further processing.
+        the date and time parts into lists for further processing. A
+        (date, time) tuple that has already been split is also accepted.
 
         Args:
-            timeString (str): Time string in format "DD/MM/YYYY HH:MM"
+            timeString (str | tuple): Time string in format "DD/MM/YYYY HH:MM",
+                                      or a ("DD/MM/YYYY", "HH:MM") tuple
 
         Returns:
             dict: Dictionary with 'date' and 'time' keys containing lists
@@ -70,8 +81,8 @@ class TokenizeToDatetime:
         #     >>> TokenizeToDatetime._splitTime("25/12/2023 14:30")
             {'date': ['25', '12', '2023'], 'time': ['14', '30']}
         """
-        # Split the string into date and time parts
-        parts = timeString.split(" ")
+        # Split the string into date and time parts unless the caller already did
+        parts = timeString if isinstance(timeString, tuple) else timeString.split(" ")
         date = parts[0].split("/")  # [day, month, year]
         times = parts[1].split(":")  # [hour, minute]
 
@@ -89,7 +100,8 @@ class TokenizeToDatetime:
         from the parsed components.
 
         Args:
-            timeString (str): Time string in format "DD/MM/YYYY HH:MM"
+            timeString (str | tuple): Time string in format "DD/MM/YYYY HH:MM",
+                                      or a ("DD/MM/YYYY", "HH:MM") tuple
 
         Raises:
             ValueError: If the time string format is invalid
@@ -107,6 +119,29 @@ class TokenizeToDatetime:
                                     int(self.timeDict['time'][1]))  # minute
 
 
+@functools.lru_cache(maxsize=2048)
+def _toDatetime(timeString):
+    """
+    Memoized TokenizeToDatetime parse of a time string (or split tuple) to a naive datetime.
+
+    The result carries no timezone, so it is the same in every configuration, and
+    datetime objects are immutable, so sharing them between callers is safe.
+
+    Zero-padded input (DD/MM/YYYY and HH:MM) is read by fixed position without
+    splitting; anything else, such as 1/7/2025, goes through TokenizeToDatetime.
+    """
+    date, clock = timeString if isinstance(timeString, tuple) else (timeString[:10], timeString[11:])
+
+    if (len(date) == 10 and date[2] == "/" and date[5] == "/" and len(clock) == 5 and clock[2] == ":"
+            and (isinstance(timeString, tuple) or timeString[10:11] == " ")):
+        # int() also accepts " 7", "+7" and non-ASCII digits, so check the fields are plain digits
+        digits = date[:2] + date[3:5] + date[6:] + clock[:2] + clock[3:]
+        if digits.isascii() and digits.isdigit():
+            return datetime(int(date[6:]), int(date[3:5]), int(date[:2]), int(clock[:2]), int(clock[3:]))
+
+    return TokenizeToDatetime(timeString).datetimeObj
+
+
 class TimeConverter:
     """
     Main utility class for time operations and conversions.
@@ -131,13 +166,13 @@ class TimeConverter:
         # >>> time_data = utility.generateTimeDataObj()
     """
 
-    def __init__(self, intoUnix: str = None, unixtime: float = None, timeDataObj: TimeData = None,):
+    def __init__(self, intoUnix: str | tuple = None, unixtime: float = None, timeDataObj: TimeData = None,):
         """
         Initialize the TimeUtility with optional time parameters.
 
         Args:
-            intoUnix (str, optional): Time string in DD/MM/YYYY HH:MM format
-                                     to be converted to Unix timestamp
+            intoUnix (str | tuple, optional): Time string in DD/MM/YYYY HH:MM format, or an
+                                     already split (date, time) tuple, to be converted to Unix timestamp
             unixtime (float, optional): Unix timestamp in UTC for processing
 
         Note:
@@ -148,7 +183,7 @@ class TimeConverter:
         self.currentTime: float = time.time()
 
         # Convert time string to datetime object if provided
-        self.intoUnix: Optional[datetime] = TokenizeToDatetime(intoUnix).datetimeObj if intoUnix else None
+        self.intoUnix: Optional[datetime] = _toDatetime(intoUnix) if intoUnix else None
 
         # Store Unix timestamp if provided
         self.unixTimeUTC: Optional[float] = unixtime
@@ -189,8 +224,9 @@ class TimeConverter:
             # >>> unix_time = utility.convertToUTC()
             # >>> print(unix_time)  # Unix timestamp for the specified time
         """
-        # Convert datetime to UTC timestamp and store it
-        unixtime = self.intoUnix.replace(tzinfo=self.timeZone).astimezone(timezone.utc).timestamp()
+        # Attach the user's timezone and read the timestamp; an aware datetime already
+        # knows its UTC instant, so there is no need to convert it to UTC first
+        unixtime = self.intoUnix.replace(tzinfo=self.timeZone).timestamp()
 
         self.unixTimeUTC = unixtime
 
@@ -220,14 +256,6 @@ class TimeConverter:
         if self.intoUnix and self.unixTimeUTC is None:
             self.convertToUTC()
 
-        # Define month and day names for human-readable formatting
-        monthNames = ["January", "February", "March",
-                      "April", "May", "June",
-                      "July", "August", "September",
-                      "October", "November", "December"]
-        dayOfWeekNames = ["Monday", "Tuesday", "Wednesday",
-                          "Thursday", "Friday", "Saturday", "Sunday"]
-
         # Load user's timezone from configuration
         userTimeZone = Configs().mainConfig['USER_TIMEZONE']
 
@@ -238,8 +266,8 @@ class TimeConverter:
         # Create and return structured TimeData object
         self.timeDataObj = TimeData(
             monthNum=int(userDateTime.month),  # Integer month number (1=January, 12=December)
-            monthName=monthNames[userDateTime.month - 1],  # Full month name
-            dayOfWeek=dayOfWeekNames[userDateTime.weekday()],  # Full day name
+            monthName=_MONTH_NAMES[userDateTime.month - 1],  # Full month name
+            dayOfWeek=_DAY_OF_WEEK_NAMES[userDateTime.weekday()],  # Full day name
             day=int(userDateTime.day),  # Day of the month as an integer
             hour=int(userDateTime.hour),  # Hour in 24-hour format as an integer
             minute=int(userDateTime.minute),  # minute
@@ -270,10 +298,14 @@ class TimeConverter:
         else:
             return self.dateTimeObj.isoformat()
 
+@functools.lru_cache(maxsize=1024)
 def toSeconds(time):
     """
     Converts a time string in HH:MM or HH:MM:SS format to total seconds.
 
+    Results are memoized, since the same clock times (e.g. "09:00") come up
+    over and over in block and task commands.
+
     Args:
         time (str): Time string in format 'HH:MM' or 'HH:MM:SS'
 
@@ -335,10 +367,14 @@ def timeOut(timeString):
         raise Exception("Invalid time format")
 
 
+@functools.lru_cache(maxsize=4096)
 def toShortHumanTime(unixTime):
     """
     Converts a Unix timestamp to a human-readable date string.
 
+    Results are memoized, since every event on the same day and every task with
+    the same due date formats the same timestamp.
+
     Args:
         unixTime (float): Unix timestamp (seconds since January 1, 1970)
 
@@ -356,10 +392,13 @@ def toShortHumanTime(unixTime):
     return realTime
 
 
+@functools.lru_cache(maxsize=4096)
 def toHumanHour(unixTime):
     """
     Converts a Unix timestamp to a human-readable time string.
 
+    Results are memoized, since event start and end times tend to repeat.
+
     Args:
         unixTime (float): Unix timestamp (seconds since January 1, 1970)
 
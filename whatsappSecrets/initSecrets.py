@@ -9,6 +9,7 @@ of existing whatsappSecrets.
 Dependencies:
 - os: For file path operations and directory management
 - json: For JSON file creation and parsing
+- orjson (optional): Faster parsing of the whatsappSecrets file when installed
 
 Classes:
 - SecretCreator: Main class for whatsappSecrets file management
@@ -23,8 +24,52 @@ Usage:
     # >>> whatsappSecrets = creator.loadedSecrets
 """
 
+import functools
 import os
 import json
+from types import MappingProxyType
+
+try:
+    # orjson parses bytes straight from the file, skipping the text decoding step
+    import orjson
+    _loadsJSON = orjson.loads
+except ImportError:
+    _loadsJSON = json.loads
+
+# whatsappSecrets.json lives next to this script; resolved once since abspath() calls getcwd()
+_SECRET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'secrets.json')
+
+
+@functools.lru_cache(maxsize=4)
+def _readSecrets(secretPath):
+    """
+    Reads and parses a whatsappSecrets file, memoized per path.
+
+    The file does not change while the application runs, so every SecretCreator
+    after the first reuses the parsed data instead of reading the file again.
+    The result is read-only because it is shared between callers. Errors are not
+    cached, so a missing file is picked up once it has been created.
+
+    Args:
+        secretPath (str): Full path to the whatsappSecrets.json file
+
+    Returns:
+        MappingProxyType: Read-only view of the parsed whatsappSecrets
+    """
+    with open(secretPath, 'rb') as f:
+        return MappingProxyType(_loadsJSON(f.read()))
+
+
+# Every field of whatsappSecrets.json, with the prompt used to ask for it
+_SECRET_PROMPTS = (
+    ("APP_ID", "Enter your app ID: "),
+    ("APP_SECRET", "Enter your app secret: "),
+    ("RECIPIENT_WAID", "Enter your recipient WaID: "),
+    ("VERSION", "Enter your version: "),
+    ("PHONE_NUMBER_ID", "Enter your phone number ID: "),
+    ("VERIFY_TOKEN", "Enter your verify token: "),
+    ("ACCESS_TOKEN", "Enter your access token: "),
+)
 
 class SecretCreator:
     """
@@ -38,7 +83,7 @@ class SecretCreator:
     Attributes:
         secretPath (str): Full path to the whatsappSecrets.json file
         secretBool (bool): Whether the whatsappSecrets.json file exists
-        loadedSecrets (dict): Dictionary containing loaded whatsappSecrets data
+        loadedSecrets (Mapping): Read-only mapping of the loaded whatsappSecrets data
 
     Example:
         >>> creator = SecretCreator()
@@ -46,25 +91,54 @@ class SecretCreator:
         >>> print(f"Access token: {access_token}")
     """
 
+    __slots__ = ('secretPath', 'secretBool', 'loadedSecrets')
+
     def __init__(self):
         """
         Initialize the SecretCreator and handle whatsappSecrets file creation/loading.
 
-        Sets up the path to whatsappSecrets.json, checks if it exists, creates it if needed,
-        and loads the whatsappSecrets data into memory.
+        Sets up the path to whatsappSecrets.json, checks if it exists, and loads the
+        whatsappSecrets data into memory. A missing file is not created here; use
+        ensure(interactive=True) for that.
         """
-        # Construct path to whatsappSecrets.json in the same directory as this script
-        self.secretPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'secrets.json')
+        # Path to whatsappSecrets.json in the same directory as this script
+        self.secretPath = _SECRET_PATH
 
         # Check if whatsappSecrets file already exists
         self.secretBool = os.path.exists(self.secretPath)
 
-        # Create whatsappSecrets file if it doesn't exist
-        # self.createSecrets() if not self.secretBool else None
+        # Never prompts here, since other modules construct this at import time;
+        # creating a missing file is left to ensure(interactive=True)
 
         # Load whatsappSecrets data into memory
         self.loadedSecrets = self.loadSecrets()
 
+    @classmethod
+    def ensure(cls, interactive=False):
+        """
+        Returns a SecretCreator whose whatsappSecrets.json file exists.
+
+        Creation is explicit: only callers that can talk to a user (the command
+        line entry point below) pass interactive=True and get prompted for a
+        missing file.
+
+        Args:
+            interactive (bool): Whether to prompt for the whatsappSecrets if the file is missing
+
+        Returns:
+            SecretCreator: An instance with the whatsappSecrets loaded
+
+        Raises:
+            Exception: If the file is missing and interactive is False
+        """
+        creator = cls()
+        if not creator.secretBool:
+            if not interactive:
+                raise Exception(f"whatsappSecrets.json not found at {creator.secretPath}. "
+                                f"Run whatsappSecrets/initSecrets.py to create it.")
+            creator.createSecrets()
+        return creator
+
     def createSecrets(self):
         """
         Interactively creates a new whatsappSecrets.json file with WhatsApp API configuration.
@@ -83,8 +157,8 @@ class SecretCreator:
         - ACCESS_TOKEN: WhatsApp Business API access token
 
         Note:
-            This method uses input() for interactive prompts, making it suitable
-            for command-line usage but not for automated scripts.
+            Values can be supplied without a terminal through the environment
+            (see _collect), so containers and CI can create the file too.
         """
         overwriteConfirm = "y"
 
@@ -97,35 +171,64 @@ class SecretCreator:
             os.makedirs(os.path.dirname(self.secretPath), exist_ok=True)
 
             # Collect all required API tokens and configuration values
-            print("Please enter your WhatsApp Business API configuration:")
-            APP_ID = input("Enter your app ID: ")
-            APP_SECRET = input("Enter your app secret: ")
-            RECIPIENT_WAID = input("Enter your recipient WaID: ")
-            VERSION = input("Enter your version: ")
-            PHONE_NUMBER_ID = input("Enter your phone number ID: ")
-            VERIFY_TOKEN = input("Enter your verify token: ")
-            ACCESS_TOKEN = input("Enter your access token: ")
-
-            # Create whatsappSecrets dictionary with all configuration values
-            secrets = {
-                "APP_ID": APP_ID,
-                "APP_SECRET": APP_SECRET,
-                "RECIPIENT_WAID": RECIPIENT_WAID,
-                "VERSION": VERSION,
-                "PHONE_NUMBER_ID": PHONE_NUMBER_ID,
-                "VERIFY_TOKEN": VERIFY_TOKEN,
-                "ACCESS_TOKEN": ACCESS_TOKEN
-            }
-
-            # Write whatsappSecrets to JSON file with proper formatting
-            with open(self.secretPath, 'w') as f:
-                json.dump(secrets, f, indent=4)
+            secrets = self._collect()
+
+            # Write whatsappSecrets to a private temporary file, then swap it into place,
+            # so a crash mid-write can never leave a truncated whatsappSecrets.json behind
+            tmpPath = self.secretPath + '.tmp'
+            fd = os.open(tmpPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(json.dumps(secrets, indent=4).encode())
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmpPath, self.secretPath)
+            except BaseException:
+                # Don't leave a partial copy of the whatsappSecrets lying around
+                try:
+                    os.unlink(tmpPath)
+                except FileNotFoundError:
+                    pass
+                raise
 
             print(f"Secrets file created successfully at: {self.secretPath}")
 
+            # Drop the memoized copy of the old file so the next load sees the new one
+            _readSecrets.cache_clear()
+            self.secretBool = True
+            self.loadedSecrets = self.loadSecrets()
+
         else:
             print("Operation cancelled.")
 
+    @staticmethod
+    def _collect():
+        """
+        Gathers the whatsappSecrets values for createSecrets.
+
+        LIFEORGS_SECRETS_JSON, if set, holds the configuration as one JSON object.
+        Any field it does not provide is read from a LIFEORGS_<FIELD> environment
+        variable, and only the fields that are still missing are prompted for
+        with input().
+
+        Returns:
+            dict: The whatsappSecrets keyed by field name
+        """
+        secretsJSON = os.environ.get('LIFEORGS_SECRETS_JSON')
+        secrets = dict(_loadsJSON(secretsJSON)) if secretsJSON else {}
+
+        for field, _ in _SECRET_PROMPTS:
+            if not secrets.get(field):
+                secrets[field] = os.environ.get(f"LIFEORGS_{field}")
+
+        if not all(secrets[field] for field, _ in _SECRET_PROMPTS):
+            print("Please enter your WhatsApp Business API configuration:")
+            for field, prompt in _SECRET_PROMPTS:
+                if not secrets[field]:
+                    secrets[field] = input(prompt)
+
+        return secrets
+
     def loadSecrets(self):
         """
         Loads whatsappSecrets from the whatsappSecrets.json file with comprehensive error handling.
@@ -135,7 +238,7 @@ class SecretCreator:
         like missing files or invalid JSON format.
 
         Returns:
-            dict: Dictionary containing all whatsappSecrets and configuration values,
+            Mapping: Read-only mapping of all whatsappSecrets and configuration values,
                   or empty dict if loading fails
 
         Raises:
@@ -149,9 +252,7 @@ class SecretCreator:
         """
         try:
             # Attempt to read and parse the whatsappSecrets file
-            with open(self.secretPath, 'r') as f:
-                secrets = json.load(f)
-            return secrets
+            return _readSecrets(self.secretPath)
 
         except FileNotFoundError:
             # Handle case where whatsappSecrets.json doesn't exist
@@ -161,6 +262,7 @@ class SecretCreator:
 
         except json.JSONDecodeError:
             # Handle case where whatsappSecrets.json contains invalid JSON
+            # (orjson.JSONDecodeError is a subclass, so this covers both parsers)
             print(f"Error: Invalid JSON in whatsappSecrets file at {self.secretPath}")
             print("Please check the file format or recreate the whatsappSecrets file.")
             return {}
@@ -181,7 +283,7 @@ if __name__ == "__main__":
     print("=" * 35)
 
     # Create SecretCreator instance (will prompt for whatsappSecrets if needed)
-    secretCreator = SecretCreator()
+    secretCreator = SecretCreator.ensure(interactive=True)
 
     # Display loaded whatsappSecrets for verification (tokens will be visible)
     print("\nLoaded whatsappSecrets configuration:")